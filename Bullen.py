@@ -29,10 +29,18 @@ if __name__ == "__main__":
         print("[DEV] Starting Bullen Audio Router in development mode (FakeEngine)")
         print("[UI] Optimized for 9\" touchscreen available at http://localhost:8000")
     
+    # Prefer uvloop for the VU publisher/WebSocket event loop when it is installed (not on Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     uvicorn.run(
         "app.server.main:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop=loop
     )
@@ -22,7 +22,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "record": True,
     # Directory where recordings will be saved
     "recordings_dir": "recordings",
-    # Size of per-channel recording queues (frames buffers)
+    # Number of period blocks in the shared recording ring buffer (all channels per block)
     "record_queue_size": 64,
     # Enable/disable automatic connection of input ports
     "auto_connect_capture": True,
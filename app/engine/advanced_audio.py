@@ -8,15 +8,19 @@ audio processing platform.
 """
 
 import numpy as np
+import sys
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 from dataclasses import dataclass
 from collections import deque
-from scipy import signal, fft
+from scipy import fft
 import logging
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 # ============================================================================
 # PSYCHOACOUSTIC MODELS
@@ -33,6 +37,8 @@ class PsychoacousticProcessor:
         self.bark_bands = self._init_bark_bands()
         self.equal_loudness_curves = self._init_equal_loudness()
         self.masking_threshold = np.zeros(24)  # 24 Bark bands
+        # Bark band index of every rfft bin (24 = outside all bands), per block length
+        self._band_label_cache: Dict[int, np.ndarray] = {}
         
     def _init_bark_bands(self) -> np.ndarray:
         """Initialize critical band (Bark scale) frequency boundaries."""
@@ -52,55 +58,69 @@ class PsychoacousticProcessor:
             80: np.array([85, 75, 66, 59, 54, 50, 48, 46, 45, 44, 43, 42, 42, 41, 40, 39, 38, 37, 36, 36, 37, 39, 42, 47])
         }
     
+    def _band_labels(self, n: int) -> np.ndarray:
+        """
+        Bark band index of every rfft bin of an n-sample block, for np.bincount.
+        Bin k is in band i when bark_bands[i] <= f_k < bark_bands[i+1]; bins outside get 24.
+        """
+        labels = self._band_label_cache.get(n)
+        if labels is None:
+            freqs = fft.rfftfreq(n, 1/self.sr)
+            labels = np.searchsorted(self.bark_bands, freqs, side='right') - 1
+            labels[(labels < 0) | (labels >= 24)] = 24
+            self._band_label_cache[n] = labels
+        return labels
+    
     def compute_loudness(self, audio: np.ndarray) -> float:
         """
         Compute perceptual loudness using Zwicker's model.
         Returns loudness in sones.
         """
-        # FFT to frequency domain
-        spectrum = np.abs(fft.rfft(audio))
-        freqs = fft.rfftfreq(len(audio), 1/self.sr)
+        # Power spectrum
+        spectrum = fft.rfft(audio)
+        power = spectrum.real ** 2
+        power += spectrum.imag ** 2
         
-        # Map to Bark bands
-        bark_power = np.zeros(24)
-        for i in range(24):
-            mask = (freqs >= self.bark_bands[i]) & (freqs < self.bark_bands[i+1])
-            bark_power[i] = np.sum(spectrum[mask] ** 2)
+        # Map to Bark bands: one weighted bincount instead of 24 masked sums
+        bark_power = np.bincount(self._band_labels(len(audio)), weights=power, minlength=25)[:24]
         
-        # Apply spreading function (simplified)
-        spread = signal.convolve(bark_power, [0.15, 0.7, 0.15], mode='same')
+        # Apply spreading function (simplified 3-tap [0.15, 0.7, 0.15], zero padded)
+        spread = 0.7 * bark_power
+        spread[1:] += 0.15 * bark_power[:-1]
+        spread[:-1] += 0.15 * bark_power[1:]
         
         # Convert to specific loudness
         specific_loudness = np.power(spread / 1e-12, 0.23)
         
         # Integrate to total loudness
-        return np.sum(specific_loudness) * 0.11
+        return float(np.sum(specific_loudness) * 0.11)
     
     def apply_masking(self, audio: np.ndarray, masker: np.ndarray) -> np.ndarray:
         """
         Apply psychoacoustic masking to reduce perceived noise.
         Uses simultaneous and temporal masking models.
         """
-        # Compute masking threshold from masker signal
-        masker_spectrum = np.abs(fft.rfft(masker))
-        freqs = fft.rfftfreq(len(masker), 1/self.sr)
+        # Compute masking threshold from masker signal: mean power per Bark band
+        masker_spectrum = fft.rfft(masker)
+        masker_power = masker_spectrum.real ** 2
+        masker_power += masker_spectrum.imag ** 2
+        labels = self._band_labels(len(masker))
+        band_sum = np.bincount(labels, weights=masker_power, minlength=25)[:24]
+        band_bins = np.bincount(labels, minlength=25)[:24]
         
-        # Update masking threshold with temporal decay
+        # Update masking threshold with temporal decay (bands without bins keep the decayed value)
         decay_factor = 0.95
         self.masking_threshold *= decay_factor
-        
-        for i in range(24):
-            mask = (freqs >= self.bark_bands[i]) & (freqs < self.bark_bands[i+1])
-            band_power = np.mean(masker_spectrum[mask] ** 2)
-            self.masking_threshold[i] = max(self.masking_threshold[i], band_power)
-        
-        # Apply masking to target audio
+        np.maximum(self.masking_threshold,
+                   np.divide(band_sum, band_bins, out=np.zeros(24), where=band_bins > 0),
+                   out=self.masking_threshold)
+        
+        # Apply masking to target audio: one gain per band (masking ratio 0.1), 1.0 outside
+        # the bands, gathered per bin
+        band_gain = np.ones(25)
+        np.exp(-0.1 * self.masking_threshold, out=band_gain[:24])
         audio_spectrum = fft.rfft(audio)
-        
-        for i in range(24):
-            mask = (freqs >= self.bark_bands[i]) & (freqs < self.bark_bands[i+1])
-            threshold = self.masking_threshold[i] * 0.1  # Masking ratio
-            audio_spectrum[mask] *= np.exp(-threshold)
+        audio_spectrum *= band_gain[self._band_labels(len(audio))]
         
         return fft.irfft(audio_spectrum, n=len(audio))
 
@@ -109,7 +129,7 @@ class PsychoacousticProcessor:
 # ADAPTIVE SIGNAL PROCESSING
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SignalStatistics:
     """Real-time signal statistics for adaptive processing."""
     rms: float = 0.0
@@ -120,6 +140,55 @@ class SignalStatistics:
     spectral_rolloff: float = 0.0
     onset_detected: bool = False
     silence_detected: bool = False
+
+
+class SignalStatisticsBatch:
+    """
+    SignalStatistics of all channels as parallel arrays (one array per field).
+    
+    Cross-channel consumers (priority scores, scene features) read a whole field at once
+    instead of one attribute per channel object. Indexing/iterating yields SignalStatistics
+    rows with plain Python values.
+    """
+    
+    _FLOAT_FIELDS = ('rms', 'peak', 'crest_factor', 'spectral_centroid',
+                     'zero_crossing_rate', 'spectral_rolloff')
+    _BOOL_FIELDS = ('onset_detected', 'silence_detected')
+    
+    def __init__(self, channels: int):
+        self.channels = channels
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(channels))
+        for name in self._BOOL_FIELDS:
+            setattr(self, name, np.zeros(channels, dtype=bool))
+    
+    @classmethod
+    def from_stats(cls, stats: Sequence[SignalStatistics]) -> 'SignalStatisticsBatch':
+        """Build a batch from per-channel SignalStatistics objects."""
+        batch = cls(len(stats))
+        for i, row in enumerate(stats):
+            batch[i] = row
+        return batch
+    
+    @classmethod
+    def coerce(cls, stats: Union['SignalStatisticsBatch', Sequence[SignalStatistics]]) -> 'SignalStatisticsBatch':
+        """Return stats as a batch, converting a list of SignalStatistics if needed."""
+        return stats if isinstance(stats, cls) else cls.from_stats(stats)
+    
+    def __len__(self) -> int:
+        return self.channels
+    
+    def __getitem__(self, channel: int) -> SignalStatistics:
+        values = {name: float(getattr(self, name)[channel]) for name in self._FLOAT_FIELDS}
+        values.update({name: bool(getattr(self, name)[channel]) for name in self._BOOL_FIELDS})
+        return SignalStatistics(**values)
+    
+    def __setitem__(self, channel: int, stats: SignalStatistics):
+        for name in self._FLOAT_FIELDS + self._BOOL_FIELDS:
+            getattr(self, name)[channel] = getattr(stats, name)
+    
+    def __iter__(self) -> Iterator[SignalStatistics]:
+        return (self[i] for i in range(self.channels))
     
     
 class AdaptiveProcessor:
@@ -131,7 +200,7 @@ class AdaptiveProcessor:
     def __init__(self, samplerate: int = 48000, channels: int = 6):
         self.sr = samplerate
         self.channels = channels
-        self.stats = [SignalStatistics() for _ in range(channels)]
+        self.stats = SignalStatisticsBatch(channels)
         self.adaptation_rate = 0.1
         
         # Adaptive parameters per channel
@@ -143,6 +212,8 @@ class AdaptiveProcessor:
         self.history_size = 10
         self.rms_history = [deque(maxlen=self.history_size) for _ in range(channels)]
         self.onset_detectors = [self._create_onset_detector() for _ in range(channels)]
+        # rfft bin frequencies per block length (blocks have a fixed size in the engine)
+        self._bin_freq_cache: Dict[int, np.ndarray] = {}
         
     def _create_onset_detector(self) -> Dict:
         """Create onset detection state for a channel."""
@@ -169,23 +240,27 @@ class AdaptiveProcessor:
         
         # Frequency domain analysis
         spectrum = np.abs(fft.rfft(audio))
-        freqs = fft.rfftfreq(len(audio), 1/self.sr)
+        freqs = self._bin_freq_cache.get(len(audio))
+        if freqs is None:
+            freqs = self._bin_freq_cache[len(audio)] = fft.rfftfreq(len(audio), 1/self.sr)
+        
+        # Spectral rolloff needs the running magnitude sum; its last element is the total
+        cumsum = np.cumsum(spectrum)
+        magnitude_sum = cumsum[-1]
         
-        # Spectral centroid (brightness indicator)
-        magnitude_sum = np.sum(spectrum)
+        # Spectral centroid (brightness indicator): one dot product, no weighted temporary
         if magnitude_sum > 0:
-            stats.spectral_centroid = np.sum(freqs * spectrum) / magnitude_sum
+            stats.spectral_centroid = float(np.dot(freqs, spectrum) / magnitude_sum)
         
         # Spectral rolloff (high frequency content)
-        cumsum = np.cumsum(spectrum)
-        rolloff_idx = np.searchsorted(cumsum, 0.85 * cumsum[-1])
+        rolloff_idx = np.searchsorted(cumsum, 0.85 * magnitude_sum)
         stats.spectral_rolloff = freqs[min(rolloff_idx, len(freqs)-1)]
         
         # Onset detection using spectral flux
         detector = self.onset_detectors[channel]
         flux = np.sum(np.maximum(0, spectrum - detector['prev_flux']))
         threshold = detector['threshold']
-        stats.onset_detected = flux > threshold
+        stats.onset_detected = bool(flux > threshold)
         
         # Adaptive threshold
         detector['threshold'] = (detector['adaptation'] * threshold + 
@@ -193,7 +268,7 @@ class AdaptiveProcessor:
         detector['prev_flux'] = spectrum
         
         # Silence detection
-        stats.silence_detected = stats.rms < 0.001
+        stats.silence_detected = bool(stats.rms < 0.001)
         
         # Update history
         self.rms_history[channel].append(stats.rms)
@@ -205,7 +280,8 @@ class AdaptiveProcessor:
         """
         Adapt processing parameters based on signal statistics.
         """
-        stats = self.stats[channel]
+        rms = self.stats.rms[channel]
+        crest_factor = self.stats.crest_factor[channel]
         history = list(self.rms_history[channel])
         
         if not history:
@@ -213,8 +289,8 @@ class AdaptiveProcessor:
         
         # Adaptive gain control
         target_rms = 0.1  # Target RMS level
-        if stats.rms > 0:
-            gain_adjustment = target_rms / stats.rms
+        if rms > 0:
+            gain_adjustment = target_rms / rms
             # Smooth adaptation to prevent artifacts
             self.adaptive_gains[channel] = (
                 (1 - self.adaptation_rate) * self.adaptive_gains[channel] +
@@ -226,9 +302,9 @@ class AdaptiveProcessor:
         self.noise_gates[channel] = noise_floor * 2
         
         # Adaptive compression ratio based on crest factor
-        if stats.crest_factor > 20:  # High dynamics
+        if crest_factor > 20:  # High dynamics
             target_ratio = 4.0
-        elif stats.crest_factor > 10:
+        elif crest_factor > 10:
             target_ratio = 2.5
         else:
             target_ratio = 1.5
@@ -260,17 +336,17 @@ class AdaptiveProcessor:
         threshold = 0.5
         ratio = self.compressor_ratios[channel]
         
-        # Compute envelope
-        envelope = np.abs(audio)
-        
-        # Soft knee compression curve
+        # Soft knee compression curve: a clamped linear ramp over the knee, evaluated
+        # in place on one envelope buffer (no transcendental, no further temporaries)
         knee_width = 0.1
-        over_threshold = np.maximum(0, envelope - threshold + knee_width/2)
-        knee_factor = over_threshold / (knee_width + 1e-10)
-        knee_factor = np.clip(knee_factor, 0, 1)
+        depth = 1 - 1/ratio
+        gain_reduction = np.abs(audio)
+        gain_reduction -= threshold - knee_width/2
+        gain_reduction *= depth / knee_width
+        np.clip(gain_reduction, 0, depth, out=gain_reduction)
+        np.subtract(1, gain_reduction, out=gain_reduction)
         
         # Apply compression
-        gain_reduction = 1 - knee_factor * (1 - 1/ratio)
         audio *= gain_reduction
         
         return audio
@@ -314,6 +390,16 @@ class IntelligentMixer:
         # Decay old correlations
         self.correlation_matrix *= self.correlation_decay
         
+        # Equal-length blocks (the normal case): all pairs from one np.corrcoef over the stacked
+        # channels; the upper triangle is mirrored so the matrix stays exactly symmetric
+        n = len(signals[0])
+        if all(len(sig) == n for sig in signals[:self.channels]):
+            corr = np.corrcoef(np.stack(signals[:self.channels]))
+            upper = np.triu_indices(self.channels, 1)
+            self.correlation_matrix[upper] = corr[upper]
+            self.correlation_matrix[upper[::-1]] = corr[upper]
+            return
+        
         # Update with new correlations
         for i in range(self.channels):
             for j in range(i+1, self.channels):
@@ -322,33 +408,26 @@ class IntelligentMixer:
                     self.correlation_matrix[i, j] = corr
                     self.correlation_matrix[j, i] = corr
     
-    def compute_priority_scores(self, stats: List[SignalStatistics]):
+    def compute_priority_scores(self, stats: Union[SignalStatisticsBatch, List[SignalStatistics]]):
         """
         Compute priority scores for each channel based on signal characteristics.
         """
-        for i in range(self.channels):
-            score = 0.0
-            
-            # Activity score
-            if not stats[i].silence_detected:
-                score += 0.3
-            
-            # Onset bonus (new events)
-            if stats[i].onset_detected:
-                score += 0.2
-            
-            # Spectral richness (prefer harmonically rich signals)
-            if stats[i].spectral_centroid > 1000:
-                score += 0.1
-            
-            # Crest factor penalty (avoid overly dynamic signals)
-            if stats[i].crest_factor < 10:
-                score += 0.1
-            
-            # Consistency bonus (stable RMS)
-            score += 0.3 * (1.0 / (1.0 + stats[i].crest_factor / 10))
-            
-            self.priority_scores[i] = score
+        stats = SignalStatisticsBatch.coerce(stats)
+        n = self.channels
+        crest = stats.crest_factor[:n]
+        
+        # Activity score
+        score = 0.3 * ~stats.silence_detected[:n]
+        # Onset bonus (new events)
+        score += 0.2 * stats.onset_detected[:n]
+        # Spectral richness (prefer harmonically rich signals)
+        score += 0.1 * (stats.spectral_centroid[:n] > 1000)
+        # Crest factor penalty (avoid overly dynamic signals)
+        score += 0.1 * (crest < 10)
+        # Consistency bonus (stable RMS)
+        score += 0.3 / (1.0 + crest / 10)
+        
+        self.priority_scores[:] = score
     
     def optimize_mix_weights(self):
         """
@@ -406,7 +485,8 @@ class IntelligentMixer:
         
         return processed
     
-    def mix(self, signals: List[np.ndarray], stats: List[SignalStatistics]) -> np.ndarray:
+    def mix(self, signals: List[np.ndarray],
+            stats: Union[SignalStatisticsBatch, List[SignalStatistics]]) -> np.ndarray:
         """
         Perform intelligent mixing of input signals.
         """
@@ -422,12 +502,8 @@ class IntelligentMixer:
         # Apply frequency masking
         processed = self.apply_frequency_masking(signals)
         
-        # Mix with optimized weights
-        mixed = np.zeros_like(processed[0])
-        for i in range(self.channels):
-            mixed += processed[i] * self.mix_weights[i]
-        
-        return mixed
+        # Mix with optimized weights: one matrix-vector product over the stacked channels
+        return self.mix_weights @ np.stack(processed)
 
 
 # ============================================================================
@@ -445,65 +521,67 @@ class SceneDetector:
         self.current_scene = 'mixed'
         self.scene_confidence = 0.0
         
-        # Feature buffers for scene analysis
-        self.feature_history = deque(maxlen=50)
+        # Ring of the last feature vectors averaged for classification (activity per channel
+        # + 4 global features), preallocated so update() does not build lists of arrays
+        self.smoothing_frames = 5
+        self._feature_ring = np.zeros((self.smoothing_frames, channels + 4))
+        self._ring_idx = 0
+        self._ring_count = 0
         
-    def extract_features(self, stats: List[SignalStatistics]) -> np.ndarray:
+    def extract_features(self, stats: Union[SignalStatisticsBatch, List[SignalStatistics]]) -> np.ndarray:
         """
         Extract features for scene classification.
         """
-        features = []
-        
-        # Channel activity pattern
-        activity = [0 if s.silence_detected else 1 for s in stats]
-        features.extend(activity)
-        
-        # Average spectral centroid (brightness)
-        avg_centroid = np.mean([s.spectral_centroid for s in stats])
-        features.append(avg_centroid / 10000)  # Normalize
-        
-        # Onset density
-        onset_count = sum(1 for s in stats if s.onset_detected)
-        features.append(onset_count / self.channels)
-        
-        # Dynamic range indicator
-        avg_crest = np.mean([s.crest_factor for s in stats])
-        features.append(min(avg_crest / 20, 1.0))
-        
-        # Zero crossing rate (harmonicity)
-        avg_zcr = np.mean([s.zero_crossing_rate for s in stats])
-        features.append(avg_zcr)
-        
-        return np.array(features)
+        stats = SignalStatisticsBatch.coerce(stats)
+        return np.concatenate((
+            # Channel activity pattern
+            ~stats.silence_detected,
+            [
+                # Average spectral centroid (brightness), normalized
+                np.mean(stats.spectral_centroid) / 10000,
+                # Onset density
+                np.count_nonzero(stats.onset_detected) / self.channels,
+                # Dynamic range indicator
+                min(np.mean(stats.crest_factor) / 20, 1.0),
+                # Zero crossing rate (harmonicity)
+                np.mean(stats.zero_crossing_rate),
+            ],
+        ))
     
     def classify_scene(self, features: np.ndarray) -> Tuple[str, float]:
         """
         Classify audio scene based on features.
         Simple rule-based classifier (could be replaced with ML model).
         """
+        # One conversion to Python floats: the rules below then compare plain floats
+        # instead of creating a NumPy scalar per feature access
+        f = features.tolist() if isinstance(features, np.ndarray) else list(features)
+        centroid, onset_density, dynamic_range, zcr = f[-4:]
+        active_channels = sum(f[:self.channels])
+        
         # Speech detection rules
         speech_score = 0.0
-        if features[-1] > 0.1 and features[-1] < 0.3:  # ZCR in speech range
+        if 0.1 < zcr < 0.3:  # ZCR in speech range
             speech_score += 0.3
-        if features[-3] < 0.5:  # Low onset density
+        if onset_density < 0.5:  # Low onset density
             speech_score += 0.2
-        if sum(features[:self.channels]) == 1:  # Single active channel
+        if active_channels == 1:  # Single active channel
             speech_score += 0.3
         
         # Music detection rules
         music_score = 0.0
-        if features[-3] > 0.3:  # High onset density
+        if onset_density > 0.3:  # High onset density
             music_score += 0.3
-        if features[-2] > 0.5:  # High dynamic range
+        if dynamic_range > 0.5:  # High dynamic range
             music_score += 0.2
-        if features[-4] > 0.3:  # High spectral centroid
+        if centroid > 0.3:  # High spectral centroid
             music_score += 0.2
         
         # Ambient detection rules
         ambient_score = 0.0
-        if features[-2] < 0.3:  # Low dynamic range
+        if dynamic_range < 0.3:  # Low dynamic range
             ambient_score += 0.3
-        if features[-3] < 0.1:  # Very low onset density
+        if onset_density < 0.1:  # Very low onset density
             ambient_score += 0.3
         
         # Determine scene
@@ -519,16 +597,17 @@ class SceneDetector:
         
         return scene, confidence
     
-    def update(self, stats: List[SignalStatistics]) -> str:
+    def update(self, stats: Union[SignalStatisticsBatch, List[SignalStatistics]]) -> str:
         """
         Update scene detection with new statistics.
         """
-        features = self.extract_features(stats)
-        self.feature_history.append(features)
+        self._feature_ring[self._ring_idx] = self.extract_features(stats)
+        self._ring_idx = (self._ring_idx + 1) % self.smoothing_frames
+        self._ring_count = min(self._ring_count + 1, self.smoothing_frames)
         
-        if len(self.feature_history) >= 5:
-            # Average features over time for stability
-            avg_features = np.mean(list(self.feature_history)[-5:], axis=0)
+        if self._ring_count == self.smoothing_frames:
+            # Average the last frames' features for stability (order does not matter for the mean)
+            avg_features = self._feature_ring.mean(axis=0)
             scene, confidence = self.classify_scene(avg_features)
             
             # Hysteresis to prevent rapid switching
@@ -553,8 +632,13 @@ class PredictiveBufferManager:
         self.channels = channels
         self.history_size = history_size
         
-        # Processing time history
-        self.proc_times = deque(maxlen=history_size)
+        # Processing time history: ring buffer of the last history_size times, with running
+        # sums so mean/std are O(1) per update
+        self._ring = np.zeros(history_size)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
         
         # Buffer size predictions
         self.predicted_sizes = np.ones(channels) * 128
@@ -568,13 +652,29 @@ class PredictiveBufferManager:
         """
         Update processing time statistics.
         """
-        self.proc_times.append(proc_time)
-        
-        if len(self.proc_times) >= 10:
-            times = np.array(self.proc_times)
-            self.mean_proc_time = np.mean(times)
-            self.std_proc_time = np.std(times)
-            self.percentile_95 = np.percentile(times, 95)
+        proc_time = float(proc_time)
+        old = self._ring[self._idx]
+        self._ring[self._idx] = proc_time
+        self._idx += 1
+        if self._count < self.history_size:
+            self._count += 1
+        else:
+            self._sum -= old
+            self._sumsq -= old * old
+        self._sum += proc_time
+        self._sumsq += proc_time * proc_time
+        if self._idx == self.history_size:
+            self._idx = 0
+            # Resync the running sums once per wrap so rounding cannot accumulate
+            self._sum = float(np.sum(self._ring))
+            self._sumsq = float(np.dot(self._ring, self._ring))
+        
+        if self._count >= 10:
+            n = self._count
+            self.mean_proc_time = self._sum / n
+            self.std_proc_time = float(np.sqrt(max(self._sumsq / n - self.mean_proc_time ** 2, 0.0)))
+            # Exact window percentile (a partition over at most history_size values)
+            self.percentile_95 = float(np.percentile(self._ring[:n], 95))
     
     def predict_buffer_size(self, target_latency: float, safety_factor: float = 1.5) -> int:
         """
@@ -585,8 +685,8 @@ class PredictiveBufferManager:
             predicted = int(target_latency / self.percentile_95)
             # Apply safety factor
             predicted = int(predicted * safety_factor)
-            # Ensure power of 2 for FFT efficiency
-            return 2 ** int(np.ceil(np.log2(max(predicted, 64))))
+            # Ensure power of 2 for FFT efficiency (next power of two >= predicted, min 64)
+            return 1 << (max(predicted, 64) - 1).bit_length()
         return 128
     
     def get_resource_allocation(self) -> Dict:
@@ -598,7 +698,7 @@ class PredictiveBufferManager:
             'processing_headroom': max(0, 1.0 - self.percentile_95 / 0.005),
             'mean_processing_time': self.mean_proc_time,
             'processing_variance': self.std_proc_time,
-            'confidence': min(len(self.proc_times) / self.history_size, 1.0)
+            'confidence': min(self._count / self.history_size, 1.0)
         }
 
 
@@ -620,7 +720,9 @@ class AdvancedTelemetry:
         
         # Quality metrics
         self.thd_measurements = np.zeros(channels)  # Total Harmonic Distortion
-        self.snr_measurements = np.zeros(channels)  # Signal-to-Noise Ratio
+        # Signal-to-Noise Ratio; nothing writes it until a measurement is made, so it starts at a
+        # clean 60 dB (above the 40 dB penalty threshold) rather than 0 dB, which would read as pure noise
+        self.snr_measurements = np.full(channels, 60.0)
         self.channel_correlation = np.eye(channels)
         
         # Processing metrics
@@ -635,21 +737,21 @@ class AdvancedTelemetry:
         """
         Measure Total Harmonic Distortion.
         """
-        spectrum = np.abs(fft.rfft(signal))
-        freqs = fft.rfftfreq(len(signal), 1/sr)
+        n = len(signal)
+        spectrum = fft.rfft(signal)
         
-        # Find fundamental peak
-        fund_idx = np.argmin(np.abs(freqs - fundamental))
-        fund_power = spectrum[fund_idx] ** 2
+        # Nearest rfft bin of the fundamental and harmonics 2..5 by index arithmetic
+        # (bin k is at k*sr/n; ties go to the lower bin, bins past Nyquist clamp to the last one)
+        bins = np.ceil(np.arange(1, 6) * fundamental * n / sr - 0.5).astype(np.intp)
+        np.clip(bins, 0, len(spectrum) - 1, out=bins)
+        peaks = spectrum[bins]
+        powers = peaks.real ** 2 + peaks.imag ** 2
         
-        # Sum harmonic powers
-        harmonic_power = 0
-        for n in range(2, 6):  # Up to 5th harmonic
-            harm_idx = np.argmin(np.abs(freqs - n * fundamental))
-            harmonic_power += spectrum[harm_idx] ** 2
+        fund_power = powers[0]
+        harmonic_power = np.sum(powers[1:])
         
         # THD percentage
-        return np.sqrt(harmonic_power / fund_power) * 100 if fund_power > 0 else 0
+        return float(np.sqrt(harmonic_power / fund_power) * 100) if fund_power > 0 else 0.0
     
     def measure_snr(self, signal: np.ndarray, noise_floor: float = 1e-6) -> float:
         """
@@ -670,22 +772,14 @@ class AdvancedTelemetry:
         """
         Compute overall system health score (0-100).
         """
-        score = 100.0
-        
-        # Penalize XRUNs
-        recent_xruns = sum(1 for t in self.xrun_timestamps if t > time.time() - 60)
-        score -= recent_xruns * 10
-        
-        # Penalize high THD
-        avg_thd = np.mean(self.thd_measurements)
-        score -= min(avg_thd, 20)
-        
-        # Penalize low SNR
-        avg_snr = np.mean(self.snr_measurements)
-        if avg_snr < 40:
-            score -= (40 - avg_snr) * 0.5
+        # Penalize XRUNs in the last minute (one clock read, one vectorized comparison)
+        recent_xruns = np.count_nonzero(np.asarray(self.xrun_timestamps) > time.time() - 60)
+        # Penalize high THD (capped at 20) and low SNR (below 40 dB)
+        avg_thd = float(np.mean(self.thd_measurements))
+        avg_snr = float(np.mean(self.snr_measurements))
+        score = 100.0 - recent_xruns * 10 - min(avg_thd, 20.0) - max(40.0 - avg_snr, 0.0) * 0.5
         
-        return max(0, score)
+        return max(0.0, score)
 
 
 # ============================================================================
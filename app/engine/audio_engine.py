@@ -1,9 +1,10 @@
+import functools
 import time
 import math
 import threading
-import queue
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
@@ -16,6 +17,25 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class _Snapshot:
+    """Control state read by the RT callback; published by reference swap, never copied in RT."""
+    selected: int
+    gains: np.ndarray
+    mutes: np.ndarray
+
+
+@dataclass
+class _Feed:
+    """Preloaded mono float32 audio mixed into one input by the RT callback."""
+    samples: np.ndarray
+    loop: bool
+    # Linear gain applied while mixing, so one decoded array serves every gain setting
+    gain: float = 1.0
+    pos: int = 0
+
+
 class AudioEngine:
     """
     JACK-based 6-channel capture, per-channel gain/mute, fast routing of a selected
@@ -24,9 +44,10 @@ class AudioEngine:
     Notes:
     - Inports: 6 mono inputs registered as 'in_1'..'in_6'. Connect from device capture ports.
     - Outports: dynamic (2 or N from config). Ports are named 'out_l', 'out_r', then 'out_3'..'out_N'.
-    - Recording: raw input (pre-mute, pre-gain) to WAV per channel to avoid destructive changes.
+    - Recording: raw input (pre-mute, pre-gain) to 16-bit PCM WAV per channel to avoid destructive changes.
       Can be adjusted via config if post-gain needed.
-    - VU: computed post-gain, pre-routing per process cycle; server samples at ~20 Hz.
+    - VU: computed post-gain, pre-routing on every Nth process cycle (~30 Hz); server samples at ~20 Hz.
+    - Feeds: preloaded WAV audio can be summed into an input in-process (start_feed/stop_feed).
     """
 
     def __init__(self, config: Dict):
@@ -54,7 +75,7 @@ class AudioEngine:
         self.record_enabled = bool(config.get('record', True))
         # Directory where recordings will be saved
         self.record_dir = Path(config.get('recordings_dir', 'recordings'))
-        # Size of recording queues (configurable for memory/performance balance)
+        # Number of blocks in the recording ring buffer (configurable for memory/performance balance)
         self.record_queue_size = max(16, int(config.get('record_queue_size', 64)))
         # Enable/disable automatic connection of input ports
         self.auto_connect_capture = bool(config.get('auto_connect_capture', True))
@@ -65,17 +86,15 @@ class AudioEngine:
         # String to match when auto-connecting playback ports
         self.playback_match = str(config.get('playback_match', 'playback')).lower()
         
-        # Pre-allocated recording buffers for RT-safety
-        self._rec_buffer_pool_size = int(config.get('rec_buffer_pool_size', 32))
-        self._rec_buffer_pool = []
-        self._rec_pool_indices = np.zeros(self.num_inputs, dtype=np.int32)
-        
         # Advanced features flag
         self.advanced_processing_enabled = bool(config.get('enable_advanced_features', False))
         self.advanced_processors = None
 
         # Create JACK client
         self.client = jack.Client('bullen', no_start_server=False)
+        # Cached JACK samplerate/blocksize (property reads cross into the C binding)
+        self._samplerate = int(self.client.samplerate)
+        self._blocksize = int(self.client.blocksize)
 
         # Ports
         # Register input ports for each channel
@@ -105,22 +124,36 @@ class AudioEngine:
         self.gains = np.ones(self.num_inputs, dtype=np.float32)
         # Mute status for each input channel
         self.mutes = np.zeros(self.num_inputs, dtype=bool)
+        # Double-buffered control snapshots: setters fill the inactive one under _lock and
+        # swap the reference, so _process reads state without locking or allocating
+        self._snapshots = [
+            _Snapshot(self.selected_ch, self.gains.copy(), self.mutes.copy()),
+            _Snapshot(self.selected_ch, self.gains.copy(), self.mutes.copy()),
+        ]
+        self._active_snapshot = self._snapshots[0]
+        # get_state() lists for the control fields (gains_linear, gains_db, mutes); built on
+        # demand and dropped by _publish_snapshot(), i.e. by every setter
+        self._control_state: Optional[Tuple[List[float], List[float], List[bool]]] = None
+        # Optional initial per-channel gains (dB, channel 1 first) applied in one update
+        if config.get('gains_db') is not None:
+            self.set_gain_db(0, config['gains_db'])
 
         # VU meters (post-gain) - optimized for ~20 Hz sampling rate
         # Peak values for VU meters (updated at ~20 Hz)
         self.vu_peak = np.zeros(self.num_inputs, dtype=np.float32)
         # RMS values for VU meters (updated at ~20 Hz)
         self.vu_rms = np.zeros(self.num_inputs, dtype=np.float32)
-        # Peak tracking buffers (updated in RT thread) - lightweight tracking only
-        self._vu_peak_temp = np.zeros(self.num_inputs, dtype=np.float32)
-        # Accumulators for RMS calculation outside RT thread
-        self._vu_sumsq_temp = np.zeros(self.num_inputs, dtype=np.float64)
-        self._vu_count_temp = np.zeros(self.num_inputs, dtype=np.int64)
+        # RT-thread VU accumulators in one preallocated block: rows are peak, sum of squares
+        # and sample count (float64 keeps the sums precise and counts exact), reset in place
+        self._vu_temp = np.zeros((3, self.num_inputs), dtype=np.float64)
+        self._vu_peak_temp, self._vu_sumsq_temp, self._vu_count_temp = self._vu_temp
         self._vu_stats_lock = threading.Lock()
         # Lock for publishing VU arrays independently of main state lock
         self._vu_pub_lock = threading.Lock()
-        # VU sampling control
-        self._last_vu_time = 0.0
+        # VU metering decimation: the UI cannot render faster than ~30 Hz, so the
+        # RT callback only computes peak/sum-of-squares every Nth period
+        self._vu_counter = 0
+        self._vu_divisor = self._compute_vu_divisor()
         # VU smoothing factors (exponential smoothing for stable display)
         self._vu_peak_smooth = np.zeros(self.num_inputs, dtype=np.float32)
         self._vu_rms_smooth = np.zeros(self.num_inputs, dtype=np.float32)
@@ -132,24 +165,32 @@ class AudioEngine:
         # VU sampling started flag
         self._vu_started = False
 
-        # Recording (raw input) - improved queue size for better reliability
-        # Queues for each channel's recording data (configurable size for memory/performance balance)
-        self._rec_queues: List[queue.Queue] = [queue.Queue(maxsize=self.record_queue_size) for _ in range(self.num_inputs)]
-        # Thread objects for recording workers
-        self._rec_threads: List[threading.Thread] = []
-        # Event to signal recording threads to stop
+        # Recording (raw input) - single-producer/single-consumer ring shared by all channels
+        # The RT callback only advances _rec_head and the writer thread only advances _rec_tail,
+        # so no lock is taken per period (plain int stores are atomic under the GIL)
+        self._rec_head = 0
+        self._rec_tail = 0
+        # Single writer thread demuxing ring slots into per-channel files
+        self._rec_thread: threading.Thread | None = None
+        # Event to signal the recording writer to stop
         self._rec_stop = threading.Event()
-        # Count of dropped buffers for each channel (improved tracking)
+        # Count of dropped buffers for each channel (written only by the RT thread)
         self._rec_drop_counts = np.zeros(self.num_inputs, dtype=np.int64)
-        # Flag indicating if recording threads have been started
+        # Flag indicating if the recording writer has been started
         self._rec_started = False
 
+        # In-process WAV feeds mixed into inputs (keyed by 0-based channel). Replaced, never
+        # mutated, by start_feed/stop_feed so the RT callback reads it without a lock.
+        self._feeds: Dict[int, _Feed] = {}
+
         # Initialize pre-allocated recording buffers after client creation
         self._init_recording_buffers()
         
         # Callback registration
         # Register the process callback function
         self.client.set_process_callback(self._process)
+        # Keep the cached blocksize in sync if JACK changes it at runtime
+        self.client.set_blocksize_callback(self._on_blocksize)
 
     # --------------- Public API ---------------
 
@@ -159,14 +200,20 @@ class AudioEngine:
         """
         # Activate JACK client
         self.client.activate()
+        # Refresh cached values now that the server is running
+        self._samplerate = int(self.client.samplerate)
+        self._blocksize = int(self.client.blocksize)
         # Auto connect ports
         if self.auto_connect_capture:
             self._auto_connect_inputs()
         if self.auto_connect_playback:
             self._auto_connect_outputs()
 
+        # Recompute VU decimation now that JACK has settled samplerate/blocksize
+        self._vu_divisor = self._compute_vu_divisor()
+
         # Recording
-        # Start recording threads if recording is enabled
+        # Start the recording writer if recording is enabled
         if self.record_enabled and not self._rec_started:
             self._start_recording_threads()
 
@@ -184,11 +231,11 @@ class AudioEngine:
         Stop the audio engine by stopping recording threads, VU sampling thread, and deactivating the JACK client.
         """
         try:
-            # Stop recording threads if they were started
+            # Stop the recording writer if it was started (it drains the ring before exiting)
             if self._rec_started:
                 self._rec_stop.set()
-                for t in self._rec_threads:
-                    t.join(timeout=3)
+                if self._rec_thread:
+                    self._rec_thread.join(timeout=3)
                 self._rec_started = False
 
             # Stop VU sampling thread if it was started
@@ -212,6 +259,7 @@ class AudioEngine:
         # Use lock to safely update the selected channel
         with self._lock:
             self.selected_ch = max(0, min(self.num_inputs - 1, int(ch_index)))
+            self._publish_snapshot()
 
     def set_gain_linear(self, ch_index: int, gain: float):
         """
@@ -227,17 +275,28 @@ class AudioEngine:
             if 0 <= ch_index < self.num_inputs:
                 # Ensure gain is not negative
                 self.gains[ch_index] = float(max(0.0, gain))
+                self._publish_snapshot()
 
-    def set_gain_db(self, ch_index: int, gain_db: float):
+    def set_gain_db(self, ch_index: int, gain_db):
         """
-        Set the gain for a specific channel in decibels.
+        Set the gain for a specific channel in decibels, or for consecutive channels at once.
         
         Args:
-            ch_index (int): Channel index (0-based)
-            gain_db (float): Gain value in decibels
+            ch_index (int): Channel index (0-based); the first channel when gain_db is a sequence
+            gain_db: Gain value in decibels, or a sequence/array of values for channels
+                ch_index, ch_index + 1, ... (extra values are ignored)
         """
-        # Convert dB gain to linear and set it
-        self.set_gain_linear(ch_index, db_to_linear(gain_db))
+        if np.ndim(gain_db) == 0:
+            # Convert dB gain to linear and set it
+            self.set_gain_linear(ch_index, db_to_linear_cached(gain_db))
+            return
+        # One vectorized conversion and one snapshot publish for all given channels
+        gains = db_to_linear_array(gain_db)
+        with self._lock:
+            if 0 <= ch_index < self.num_inputs:
+                n = min(len(gains), self.num_inputs - ch_index)
+                self.gains[ch_index:ch_index + n] = gains[:n]
+                self._publish_snapshot()
 
     def set_mute(self, ch_index: int, mute: bool):
         """
@@ -252,6 +311,55 @@ class AudioEngine:
             # Validate channel index
             if 0 <= ch_index < self.num_inputs:
                 self.mutes[ch_index] = bool(mute)
+                self._publish_snapshot()
+
+    def start_feed(self, ch_index: int, samples: np.ndarray, loop: bool = True, gain: float = 1.0):
+        """
+        Mix preloaded audio into an input, as if a JACK client were connected to it.
+        
+        Args:
+            ch_index (int): Channel index (0-based)
+            samples (np.ndarray): Mono audio at the JACK samplerate, in [-1, 1]; only read
+            loop (bool): Restart from the beginning when the end is reached
+            gain (float): Linear gain applied to the feed (result clipped to [-1, 1])
+        """
+        if not 0 <= ch_index < self.num_inputs:
+            raise ValueError(f"Channel index out of range (0..{self.num_inputs - 1})")
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        if samples.size == 0:
+            raise ValueError("Feed audio is empty")
+        with self._lock:
+            feeds = dict(self._feeds)
+            feeds[ch_index] = _Feed(samples, bool(loop), max(0.0, float(gain)))
+            self._feeds = feeds
+
+    def stop_feed(self, ch_index: int) -> bool:
+        """
+        Stop feeding an input.
+        
+        Args:
+            ch_index (int): Channel index (0-based)
+            
+        Returns:
+            bool: True if a feed was active on the channel
+        """
+        with self._lock:
+            if ch_index not in self._feeds:
+                return False
+            feeds = dict(self._feeds)
+            del feeds[ch_index]
+            self._feeds = feeds
+            return True
+
+    def active_feeds(self) -> List[int]:
+        """
+        Get channels that currently have an active feed (finished non-looping feeds excluded).
+        
+        Returns:
+            List[int]: Channel indices (0-based)
+        """
+        feeds = self._feeds
+        return sorted(ch for ch, f in feeds.items() if f.loop or f.pos < f.samples.shape[0])
 
     def get_state(self) -> Dict:
         """
@@ -262,12 +370,17 @@ class AudioEngine:
         """
         # Read main state under main lock
         with self._lock:
-            sr = self.client.samplerate
-            bs = self.client.blocksize
+            sr = self._samplerate
+            bs = self._blocksize
             sel_ch = int(self.selected_ch + 1)
-            gains_linear = self.gains.tolist()
-            gains_db = [linear_to_db(g) for g in self.gains]
-            mutes = self.mutes.astype(bool).tolist()
+            if self._control_state is None:
+                self._control_state = (
+                    self.gains.tolist(),
+                    linear_to_db_array(self.gains).tolist(),
+                    self.mutes.astype(bool).tolist(),
+                )
+            # Shallow list copies so callers cannot mutate the cache
+            gains_linear, gains_db, mutes = (list(v) for v in self._control_state)
             recording = bool(self.record_enabled)
             drops = self._rec_drop_counts.tolist()
 
@@ -289,6 +402,36 @@ class AudioEngine:
             'rec_dropped_buffers': drops,
         }
 
+    def get_vu_state(self) -> Dict:
+        """
+        Get only the fields published to VU clients (cheaper than get_state()).
+        
+        Returns:
+            Dict: 'selected_channel' (1-based) plus NumPy arrays 'gains_db', 'mutes',
+            'vu_peak' and 'vu_rms'
+        """
+        with self._lock:
+            sel_ch = int(self.selected_ch + 1)
+            gains = self.gains.copy()
+            mutes = self.mutes.copy()
+
+        with self._vu_pub_lock:
+            vu_peak = self.vu_peak.copy()
+            vu_rms = self.vu_rms.copy()
+
+        # Vectorized linear_to_db (same -240 dB floor)
+        np.maximum(gains, 1e-12, out=gains)
+        np.log10(gains, out=gains)
+        gains *= 20.0
+
+        return {
+            'selected_channel': sel_ch,
+            'gains_db': gains,
+            'mutes': mutes,
+            'vu_peak': vu_peak,
+            'vu_rms': vu_rms,
+        }
+
     # --------------- Internal ---------------
     
     def _init_advanced_features(self):
@@ -304,9 +447,9 @@ class AudioEngine:
             )
             
             self.advanced_processors = {
-                'psychoacoustic': PsychoacousticProcessor(self.client.samplerate),
-                'adaptive': AdaptiveProcessor(self.client.samplerate, self.num_inputs),
-                'mixer': IntelligentMixer(self.num_inputs, self.client.samplerate),
+                'psychoacoustic': PsychoacousticProcessor(self._samplerate),
+                'adaptive': AdaptiveProcessor(self._samplerate, self.num_inputs),
+                'mixer': IntelligentMixer(self.num_inputs, self._samplerate),
                 'scene': SceneDetector(self.num_inputs),
                 'buffer_mgr': PredictiveBufferManager(self.num_inputs),
                 'telemetry': AdvancedTelemetry(self.num_inputs)
@@ -319,30 +462,90 @@ class AudioEngine:
             logger.error(f"Failed to initialize advanced features: {e}")
             self.advanced_processing_enabled = False
     
+    def _publish_snapshot(self):
+        """Copy control state into the inactive snapshot and make it active. Caller holds _lock."""
+        snap = self._snapshots[1] if self._active_snapshot is self._snapshots[0] else self._snapshots[0]
+        snap.selected = int(self.selected_ch)
+        snap.gains[:] = self.gains
+        snap.mutes[:] = self.mutes
+        # Single reference assignment is atomic in CPython
+        self._active_snapshot = snap
+        self._control_state = None
+
+    def _on_blocksize(self, blocksize: int):
+        """
+        JACK blocksize callback: keep the period-sized state in step with the new blocksize.
+        JACK suspends processing while this runs, so buffers can be reallocated here.
+        """
+        self._blocksize = int(blocksize)
+        if self._blocksize > self._rec_scratch.shape[0]:
+            self._grow_frame_buffers(self._blocksize)
+        # VU decimation is a period count, so it depends on the blocksize
+        self._vu_divisor = self._compute_vu_divisor()
+
+    def _grow_frame_buffers(self, max_frames: int):
+        """Reallocate the recording ring and scratch buffers for periods of up to max_frames."""
+        self._rec_scratch = np.zeros(max_frames, dtype=np.float32)
+        self._feed_scratch = np.zeros((self.num_inputs, max_frames), dtype=np.float32)
+        # Carry over slots the writer thread has not consumed yet, then publish the new ring
+        ring = np.zeros((self._rec_slots, self.num_inputs, max_frames), dtype=np.int16)
+        old = self._rec_ring
+        ring[:, :, :old.shape[2]] = old
+        self._rec_ring = ring
+
+    def _compute_vu_divisor(self, target_hz: float = 30.0) -> int:
+        """Number of process periods between VU measurements for ~target_hz metering."""
+        periods_per_sec = float(self._samplerate) / max(1, self._blocksize)
+        return max(1, int(periods_per_sec / target_hz))
+
     def _init_recording_buffers(self):
-        """Initialize pre-allocated recording buffers for RT-safety."""
-        # Pre-allocate buffers based on maximum expected frame size
-        max_frames = self.client.blocksize if hasattr(self.client, 'blocksize') else 1024
-        for ch in range(self.num_inputs):
-            ch_buffers = []
-            for _ in range(self._rec_buffer_pool_size):
-                ch_buffers.append(np.zeros(max_frames, dtype=np.float32))
-            self._rec_buffer_pool.append(ch_buffers)
+        """Initialize the pre-allocated recording ring buffer for RT-safety."""
+        # Pre-allocate slots based on maximum expected frame size
+        max_frames = self._blocksize or 1024
+        self._rec_slots = self.record_queue_size
+        # Recordings are PCM_16; quantize in the callback so the writer does a raw copy.
+        # Layout is (slot, channel, frame) so one period for all channels is a single slot.
+        self._rec_ring = np.zeros((self._rec_slots, self.num_inputs, max_frames), dtype=np.int16)
+        # Valid frame count per slot (JACK may deliver short periods)
+        self._rec_ring_frames = np.zeros(self._rec_slots, dtype=np.int32)
+        # Float scratch used for scaling/clipping before int16 quantization
+        self._rec_scratch = np.zeros(max_frames, dtype=np.float32)
+        # Per-input scratch for inputs with an active feed (capture + feed sum)
+        self._feed_scratch = np.zeros((self.num_inputs, max_frames), dtype=np.float32)
 
     def _process(self, frames: int):
         """
-        JACK process callback function that handles audio routing, VU meter updates, and recording.
+        JACK process callback function that handles recording, VU meter updates, and audio routing.
         This function is called for every audio buffer period and must be non-blocking.
         
         Args:
             frames (int): Number of audio frames in the buffer
         """
-        # Acquire state snapshot without blocking the RT thread long
-        # This ensures thread safety while minimizing time spent in the lock
-        with self._lock:
-            sel = int(self.selected_ch)
-            gains = self.gains.copy()
-            mutes = self.mutes.copy()
+        # Read the published control snapshot (no lock, no copy)
+        snap = self._active_snapshot
+        sel = snap.selected
+        gains = snap.gains
+        mutes = snap.mutes
+
+        # Decide whether this period contributes to VU metering (~30 Hz)
+        self._vu_counter += 1
+        do_vu = self._vu_counter >= self._vu_divisor
+        if do_vu:
+            self._vu_counter = 0
+
+        # Claim a recording ring slot for this period (raw input is quantized in the input loop)
+        rec_slot = -1
+        if self.record_enabled and self._rec_started:
+            rec_head = self._rec_head
+            if rec_head - self._rec_tail >= self._rec_slots:
+                # Ring is full: drop this period for every channel (no logging in RT thread)
+                self._rec_drop_counts += 1
+            else:
+                rec_slot = rec_head % self._rec_slots
+                rec_scratch = self._rec_scratch[:frames]
+
+        # Active WAV feeds (published by reference, read without lock)
+        feeds = self._feeds
 
         # Collect input buffers
         input_buffers = []
@@ -354,8 +557,24 @@ class AudioEngine:
         for i, inport in enumerate(self.inports):
             # Get audio buffer from input port
             buf = inport.get_array()  # np.ndarray float32, shape (frames,)
+            if feeds:
+                feed = feeds.get(i)
+                if feed is not None:
+                    # Sum the feed with the captured signal in scratch (JACK port buffers are read-only)
+                    mixed = self._feed_scratch[i, :frames]
+                    self._read_feed(feed, mixed)
+                    mixed += buf
+                    buf = mixed
             input_buffers.append(buf.copy() if self.advanced_processing_enabled else buf)
             
+            # Record raw input (pre-mute, pre-gain): quantize to int16 directly into the ring slot
+            if rec_slot >= 0:
+                np.multiply(buf, 32767.0, out=rec_scratch)
+                np.clip(rec_scratch, -32768.0, 32767.0, out=rec_scratch)
+                # Round like libsndfile's float->PCM_16 path (the int16 store alone truncates toward 0)
+                np.rint(rec_scratch, out=rec_scratch)
+                self._rec_ring[rec_slot, i, :frames] = rec_scratch
+            
             # Apply gain and mute settings
             # VU uses post-gain signal - only track peaks in RT thread (lightweight)
             g = 0.0 if mutes[i] else gains[i]
@@ -364,7 +583,7 @@ class AudioEngine:
             
             # Update peak tracking only (lightweight operation for RT thread)
             # RMS accumulation moved to separate thread for ~20 Hz sampling
-            if frames > 0:
+            if do_vu and frames > 0:
                 # Track peak value (simple absolute value max)
                 current_peak = float(np.max(np.abs(post_gain)))
                 # Keep the highest peak since last VU update
@@ -380,13 +599,20 @@ class AudioEngine:
             if i == sel:
                 route_buf = post_gain
 
+        # Publish the recording slot only after all channels are written
+        if rec_slot >= 0:
+            self._rec_ring_frames[rec_slot] = frames
+            self._rec_head = rec_head + 1
+
         # Apply advanced processing if enabled
         if self.advanced_processing_enabled and self.advanced_processors:
             try:
-                # Analyze signals
-                stats = []
+                # Analyze signals: results land in the adaptive processor's batch, which is
+                # handed on as-is (no per-period list or batch conversion on the RT thread)
+                adaptive = self.advanced_processors['adaptive']
                 for i, buf in enumerate(input_buffers):
-                    stats.append(self.advanced_processors['adaptive'].analyze_signal(buf, i))
+                    adaptive.analyze_signal(buf, i)
+                stats = adaptive.stats
                 
                 # Detect scene
                 scene = self.advanced_processors['scene'].update(stats)
@@ -403,9 +629,7 @@ class AudioEngine:
                 
                 # Apply adaptive processing
                 for i in range(len(processed_buffers)):
-                    processed_buffers[i] = self.advanced_processors['adaptive'].process(
-                        processed_buffers[i], i
-                    )
+                    processed_buffers[i] = adaptive.process(processed_buffers[i], i)
                 
                 # Intelligent mixing for multi-channel output
                 if self.num_outputs > 2 and scene in ['music', 'mixed']:
@@ -442,28 +666,26 @@ class AudioEngine:
                 for o in self.outports:
                     o.get_array()[:] = route_buf
 
-        # Enqueue raw input for recording (non-blocking with pre-allocated buffers)
-        # Only record if recording is enabled and threads have been started
-        if self.record_enabled and self._rec_started:
-            for i, inport in enumerate(self.inports):
-                # Use pre-allocated buffer from pool (RT-safe, no memory allocation)
-                pool_idx = self._rec_pool_indices[i]
-                rec_buffer = self._rec_buffer_pool[i][pool_idx]
-                
-                # Copy data to pre-allocated buffer
-                input_data = inport.get_array()
-                rec_buffer[:frames] = input_data
-                
-                try:
-                    # Try to add buffer reference to recording queue
-                    self._rec_queues[i].put_nowait((rec_buffer[:frames].copy(), frames))
-                except queue.Full:
-                    # If queue is full, increment drop counter (no logging in RT thread)
-                    with self._lock:
-                        self._rec_drop_counts[i] += 1
-                
-                # Advance to next buffer in pool
-                self._rec_pool_indices[i] = (pool_idx + 1) % self._rec_buffer_pool_size
+    @staticmethod
+    def _read_feed(feed: _Feed, dst: np.ndarray):
+        """Write the next len(dst) feed samples with gain into dst, wrapping or zero-padding at the end."""
+        samples = feed.samples
+        n = samples.shape[0]
+        frames = dst.shape[0]
+        k = 0
+        while k < frames:
+            if feed.pos >= n:
+                if not feed.loop:
+                    dst[k:] = 0.0
+                    break
+                feed.pos = 0
+            take = min(frames - k, n - feed.pos)
+            dst[k:k + take] = samples[feed.pos:feed.pos + take]
+            feed.pos += take
+            k += take
+        if feed.gain != 1.0:
+            dst *= feed.gain
+            np.clip(dst, -1.0, 1.0, out=dst)
 
     def _auto_connect_inputs(self):
         """
@@ -578,14 +800,16 @@ class AudioEngine:
                 time.sleep(vu_interval)
 
                 # Copy peak tracking buffers for processing (no main-state lock to avoid contention)
-                peak_temp = self._vu_peak_temp.copy()
+                peak_temp = self._vu_peak_temp.astype(np.float32)
 
-                # Snapshot and reset accumulators for RMS outside RT thread
+                # Snapshot and reset the sum-of-squares and count rows together outside RT thread
                 with self._vu_stats_lock:
-                    sumsq = self._vu_sumsq_temp.copy()
-                    counts = self._vu_count_temp.copy()
-                    self._vu_sumsq_temp.fill(0.0)
-                    self._vu_count_temp.fill(0)
+                    sumsq, counts = self._vu_temp[1:].copy()
+                    self._vu_temp[1:] = 0.0
+
+                # No metered period landed in this interval (decimated metering); keep last values
+                if not np.any(counts):
+                    continue
 
                 # Compute RMS using accumulated sums
                 rms_values = np.zeros(self.num_inputs, dtype=np.float32)
@@ -604,9 +828,6 @@ class AudioEngine:
                 # Reset peak tracking for next sampling period
                 self._vu_peak_temp.fill(0.0)
 
-                # Update timing
-                self._last_vu_time = time.time()
-
             except Exception as e:
                 # Log error but continue VU sampling
                 logger.exception("VU worker error: %s", e)
@@ -615,56 +836,88 @@ class AudioEngine:
 
     def _start_recording_threads(self):
         """
-        Start recording threads for each input channel.
+        Start the recording writer thread for all input channels.
         """
         # Create directory per run
         ts = time.strftime('%Y%m%d_%H%M%S')
         session_dir = self.record_dir / ts
         session_dir.mkdir(parents=True, exist_ok=True)
+        paths = [session_dir / f'channel_{i + 1}.wav' for i in range(self.num_inputs)]
 
-        # Clear stop event and reset threads list
+        # Clear stop event and reset the ring before the RT thread starts producing
         self._rec_stop.clear()
-        self._rec_threads = []
+        self._rec_head = 0
+        self._rec_tail = 0
 
-        # Start a recording thread for each input channel
-        for i in range(self.num_inputs):
-            ch_path = session_dir / f'channel_{i + 1}.wav'
-            # Not using daemon=True to ensure proper buffer flushing on shutdown
-            t = threading.Thread(target=self._rec_worker, args=(i, ch_path), daemon=False)
-            self._rec_threads.append(t)
-            t.start()
+        # Not using daemon=True to ensure proper buffer flushing on shutdown
+        self._rec_thread = threading.Thread(target=self._rec_writer, args=(paths,), daemon=False)
+        self._rec_thread.start()
 
         # Mark recording as started
         self._rec_started = True
 
-    def _rec_worker(self, ch_index: int, path: Path):
+    def _rec_writer(self, paths: List[Path]):
         """
-        Worker function for recording audio from a specific channel.
+        Worker function draining the recording ring and demuxing each slot into per-channel files.
         """
-        with sf.SoundFile(str(path), mode='w', samplerate=self.client.samplerate, channels=1, subtype='PCM_24', format='WAV') as f:
-            while not self._rec_stop.is_set():
-                try:
-                    # Get tuple of (buffer, frames) from queue
-                    data = self._rec_queues[ch_index].get(timeout=0.2)
-                    if isinstance(data, tuple):
-                        block, frames = data
-                    else:
-                        # Fallback for compatibility
-                        block = data
-                except queue.Empty:
+        files = [
+            sf.SoundFile(str(p), mode='w', samplerate=self._samplerate, channels=1, subtype='PCM_16', format='WAV')
+            for p in paths
+        ]
+        try:
+            while True:
+                head = self._rec_head
+                tail = self._rec_tail
+                if tail == head:
+                    # Ring drained; exit once stop was requested, otherwise poll again shortly
+                    if self._rec_stop.is_set():
+                        break
+                    self._rec_stop.wait(0.02)
                     continue
-                # Ensure shape (n, 1) for proper WAV file format
-                if block.ndim == 1:
-                    f.write(block.reshape(-1, 1))
-                else:
-                    f.write(block)
+                for pos in range(tail, head):
+                    slot = pos % self._rec_slots
+                    frames = int(self._rec_ring_frames[slot])
+                    # Blocks are already int16 PCM: write raw without libsndfile float conversion
+                    for i, f in enumerate(files):
+                        f.buffer_write(self._rec_ring[slot, i, :frames], dtype='int16')
+                # Release the consumed slots back to the RT thread
+                self._rec_tail = head
+        finally:
+            for f in files:
+                f.close()
 
 # --------------- Utils ---------------
 
+# dB <-> linear via exp/log with the base change folded into one constant each
+_LN10_OVER_20 = math.log(10.0) / 20.0
+_20_OVER_LN10 = 20.0 / math.log(10.0)
+
+
 def db_to_linear(db: float) -> float:
-    return float(10.0 ** (db / 20.0))
+    return math.exp(db * _LN10_OVER_20)
+
+
+@functools.lru_cache(maxsize=256)
+def db_to_linear_cached(db: float) -> float:
+    """db_to_linear memoized for the small set of dB values UI faders send."""
+    return math.exp(db * _LN10_OVER_20)
 
 
 def linear_to_db(lin: float) -> float:
     lin = max(1e-12, float(lin))
-    return 20.0 * math.log10(lin)
+    return math.log(lin) * _20_OVER_LN10
+
+
+def db_to_linear_array(db) -> np.ndarray:
+    """Vectorized db_to_linear for several channels at once (float32, exact exp form)."""
+    x = np.asarray(db, dtype=np.float32) * np.float32(_LN10_OVER_20)
+    np.exp(x, out=x)
+    return x
+
+
+def linear_to_db_array(lin) -> np.ndarray:
+    """Vectorized linear_to_db (same 1e-12 floor)."""
+    x = np.maximum(np.asarray(lin, dtype=np.float64), 1e-12)
+    np.log(x, out=x)
+    x *= _20_OVER_LN10
+    return x
@@ -1,9 +1,10 @@
-import math
 import threading
 from typing import Dict
 
 import numpy as np
 
+from app.engine.audio_engine import db_to_linear, db_to_linear_array, linear_to_db_array
+
 
 class DummyEngine:
     """
@@ -29,6 +30,8 @@ class DummyEngine:
         self.selected_ch = max(0, min(self.num_inputs - 1, int(config.get("selected_channel", 1)) - 1))
         self.gains = np.ones(self.num_inputs, dtype=np.float32)
         self.mutes = np.zeros(self.num_inputs, dtype=bool)
+        if config.get("gains_db") is not None:
+            self.set_gain_db(0, config["gains_db"])
 
         self.vu_peak = np.zeros(self.num_inputs, dtype=np.float32)
         self.vu_rms = np.zeros(self.num_inputs, dtype=np.float32)
@@ -53,8 +56,15 @@ class DummyEngine:
             if 0 <= ch_index < self.num_inputs:
                 self.gains[ch_index] = float(max(0.0, gain))
 
-    def set_gain_db(self, ch_index: int, gain_db: float):
-        self.set_gain_linear(ch_index, db_to_linear(gain_db))
+    def set_gain_db(self, ch_index: int, gain_db):
+        if np.ndim(gain_db) == 0:
+            self.set_gain_linear(ch_index, db_to_linear(gain_db))
+            return
+        gains = db_to_linear_array(gain_db)
+        with self._lock:
+            if 0 <= ch_index < self.num_inputs:
+                n = min(len(gains), self.num_inputs - ch_index)
+                self.gains[ch_index:ch_index + n] = gains[:n]
 
     def set_mute(self, ch_index: int, mute: bool):
         with self._lock:
@@ -68,21 +78,10 @@ class DummyEngine:
                 "frames_per_period": int(self.frames_per_period),
                 "selected_channel": int(self.selected_ch + 1),
                 "gains_linear": self.gains.tolist(),
-                "gains_db": [linear_to_db(g) for g in self.gains],
+                "gains_db": linear_to_db_array(self.gains).tolist(),
                 "mutes": self.mutes.astype(bool).tolist(),
                 "vu_peak": self.vu_peak.tolist(),
                 "vu_rms": self.vu_rms.tolist(),
                 "recording": False,
                 "rec_dropped_buffers": self._rec_drop_counts.tolist(),
             }
-
-
-# --------------- Utils ---------------
-
-def db_to_linear(db: float) -> float:
-    return float(10.0 ** (db / 20.0))
-
-
-def linear_to_db(lin: float) -> float:
-    lin = max(1e-12, float(lin))
-    return 20.0 * math.log10(lin)
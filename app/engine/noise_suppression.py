@@ -50,7 +50,7 @@ class VoiceActivityDetector:
         Uses multiple features for robust detection.
         """
         # Energy detection
-        energy = np.mean(frame ** 2)
+        energy = float(np.dot(frame, frame)) / len(frame)
         self.energy_history.append(energy)
         
         if len(self.energy_history) < 10:
@@ -66,16 +66,8 @@ class VoiceActivityDetector:
         zcr = np.sum(np.diff(np.sign(frame)) != 0) / len(frame)
         zcr_vad = self.zcr_threshold_low < zcr < self.zcr_threshold_high
         
-        # Spectral flatness (distinguish speech from noise)
-        spectrum = np.abs(fft.rfft(frame))
-        geometric_mean = np.exp(np.mean(np.log(spectrum + 1e-10)))
-        arithmetic_mean = np.mean(spectrum)
-        spectral_flatness = geometric_mean / (arithmetic_mean + 1e-10)
-        
-        spectral_vad = spectral_flatness < self.spectral_flatness_threshold
-        
-        # Combine detectors
-        voice_detected = energy_vad and (zcr_vad or spectral_vad)
+        # Combine detectors; spectral flatness only matters when energy passes and ZCR does not
+        voice_detected = energy_vad and (zcr_vad or self._spectral_vad(frame))
         
         # Apply hangover
         if voice_detected:
@@ -87,6 +79,19 @@ class VoiceActivityDetector:
         
         return False
 
+    def _spectral_vad(self, frame: np.ndarray) -> bool:
+        """
+        Spectral flatness test (distinguish speech from noise) on at most one VAD frame.
+        """
+        spectrum = np.abs(fft.rfft(frame[:self.frame_size]))
+        arithmetic_mean = float(np.mean(spectrum))
+        # Log in place on the magnitude buffer for the geometric mean
+        spectrum += 1e-10
+        np.log(spectrum, out=spectrum)
+        geometric_mean = float(np.exp(np.mean(spectrum)))
+        spectral_flatness = geometric_mean / (arithmetic_mean + 1e-10)
+        return spectral_flatness < self.spectral_flatness_threshold
+
 
 # ============================================================================
 # SPECTRAL SUBTRACTION
@@ -145,27 +150,30 @@ class SpectralSubtractor:
         # FFT
         spectrum = fft.rfft(frame, n=self.fft_size)
         magnitude = np.abs(spectrum)
-        phase = np.angle(spectrum)
         
         # Spectral subtraction with over-subtraction
         if is_speech:
             # Less aggressive during speech
-            subtracted = magnitude - self.subtraction_factor * self.noise_spectrum
+            factor = self.subtraction_factor
         else:
             # More aggressive during silence
-            subtracted = magnitude - (self.subtraction_factor * 1.5) * self.noise_spectrum
+            factor = self.subtraction_factor * 1.5
+        gain = self.noise_spectrum * -factor
+        gain += magnitude
         
         # Apply spectral floor
-        subtracted = np.maximum(subtracted, self.spectral_floor * magnitude)
+        np.maximum(gain, self.spectral_floor * magnitude, out=gain)
         
-        # Smooth gain to reduce musical noise
-        gain = subtracted / (magnitude + 1e-10)
-        gain = self.smoothing_factor * self.prev_gain + (1 - self.smoothing_factor) * gain
-        self.prev_gain = gain
+        # Smooth gain in place to reduce musical noise
+        magnitude += 1e-10
+        gain /= magnitude
+        gain *= 1 - self.smoothing_factor
+        self.prev_gain *= self.smoothing_factor
+        self.prev_gain += gain
         
-        # Apply gain and reconstruct
-        enhanced_spectrum = magnitude * gain * np.exp(1j * phase)
-        enhanced = fft.irfft(enhanced_spectrum, n=self.fft_size)
+        # Apply real gain to the complex spectrum (keeps phase) and reconstruct
+        spectrum *= self.prev_gain
+        enhanced = fft.irfft(spectrum, n=self.fft_size)
         
         return enhanced[:len(frame)]
 
@@ -310,6 +318,9 @@ class CallCenterNoiseSuppressor:
         # Comfort noise generation
         self.comfort_noise_level = 0.01
         self.noise_generator = np.random.RandomState(42)
+        # One second of unit-variance noise, read cyclically instead of drawing randn per block
+        self.noise_table = self.noise_generator.randn(samplerate)
+        self.noise_pos = 0
         
     def process_channel(self, audio: np.ndarray, channel: int, 
                         reference_channels: Optional[Dict[int, np.ndarray]] = None) -> np.ndarray:
@@ -341,8 +352,9 @@ class CallCenterNoiseSuppressor:
         
         # Step 5: Comfort noise injection during silence
         if not is_speech:
-            comfort_noise = self.noise_generator.randn(len(processed)) * self.comfort_noise_level
-            processed = processed * 0.1 + comfort_noise  # Heavily attenuate + comfort noise
+            # Heavily attenuate + comfort noise, in place on the filter output
+            processed *= 0.1
+            processed += self.comfort_noise_level * self._next_noise(len(processed))
         
         # Step 6: Automatic gain control to maintain consistent levels
         target_level = 0.1
@@ -354,6 +366,18 @@ class CallCenterNoiseSuppressor:
         
         return processed
     
+    def _next_noise(self, n: int) -> np.ndarray:
+        """
+        Return the next n samples of the precomputed comfort noise table.
+        """
+        if n > len(self.noise_table):
+            return self.noise_generator.randn(n)
+        if self.noise_pos + n > len(self.noise_table):
+            self.noise_pos = 0
+        start = self.noise_pos
+        self.noise_pos += n
+        return self.noise_table[start:start + n]
+    
     def process_multi_channel(self, channels_audio: Dict[int, np.ndarray]) -> Dict[int, np.ndarray]:
         """
         Process multiple channels with cross-channel noise cancellation.
@@ -366,12 +390,11 @@ class CallCenterNoiseSuppressor:
         """
         processed_channels = {}
         
+        # Channels are processed serially: the VAD, spectral subtractor, Wiener filter and
+        # the per-reference cancellers are shared between channels, so they cannot run concurrently
         for ch, audio in channels_audio.items():
-            # Get reference channels (all except current)
-            reference = {k: v for k, v in channels_audio.items() if k != ch}
-            
-            # Process with cross-channel cancellation
-            processed_channels[ch] = self.process_channel(audio, ch, reference)
+            # All channels serve as the reference table; process_channel skips the current one
+            processed_channels[ch] = self.process_channel(audio, ch, channels_audio)
         
         return processed_channels
     
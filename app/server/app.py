@@ -1,26 +1,202 @@
 import asyncio
 import json
 import logging
+import math
 import os
+import re
 import subprocess
 import sys
+import threading
 import tempfile
 import shutil
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, Optional, Any, Set, List
+from typing import Dict, Optional, Any, List, Tuple
 
+import numpy as np
 import soundfile as sf
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException, Request
+from fastapi.responses import RedirectResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import contextlib
 from scripts.make_test_wavs import make_tone  # reuse tone writer
+from scripts.feed_wav_to_input import db_to_linear, load_feed_audio  # reuse WAV load/resample for in-process feeds
+
+try:
+    import orjson  # Fast JSON encoder for the VU broadcast
+except Exception:  # pragma: no cover
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Filesystem locations, resolved once at import
+_HERE = Path(__file__).resolve()
+_PROJECT_ROOT = _HERE.parents[2]
+_SCRIPTS_DIR = _PROJECT_ROOT / "scripts"
+_UI_DIR = _HERE.parents[1] / "ui"
+_TEST_WAVS_DIR = _PROJECT_ROOT / "test_wavs"
+_UPLOADS_DIR = _PROJECT_ROOT / "uploads"
+
+# Generated test WAV names: ch<input>_<label>.wav
+_TEST_WAV_RE = re.compile(r"ch(\d+)_.*\.wav")
+# Deletable upload names: one path component (keeps the user's original stem, incl. non-ASCII)
+_UPLOAD_NAME_RE = re.compile(r"[^/\\\x00]+\.wav")
+
+# Fast paths for the fixed-shape slider/button bodies ({"gain_db": -6}, {"mute": true});
+# anything else falls back to a full JSON decode
+_GAIN_BODY_RE = re.compile(rb'\s*\{\s*"(gain_db|gain_linear)"\s*:\s*(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*\}\s*')
+# Gain range the UI faders cover; API values are clamped to it (linear: 0 .. +20 dB)
+_GAIN_DB_MIN = -60.0
+_GAIN_DB_MAX = 20.0
+_GAIN_LINEAR_MAX = 10.0
+_MUTE_BODY_RE = re.compile(rb'\s*\{\s*"mute"\s*:\s*(true|false)\s*\}\s*')
+
+# Fixed JSON body for control endpoints that only acknowledge success
+_OK_BODY = b'{"ok":true}'
+
+# Total size of decoded feed audio kept for reuse (float32 mono: ~11 MB per minute at 48 kHz)
+_FEED_CACHE_MAX_BYTES = 128 << 20
+
+# Chunk size used when spooling uploads to disk
+_UPLOAD_COPY_CHUNK = 1 << 20
+# Mono WAV uploads in these sample formats are stored without decoding/re-encoding
+_PASSTHROUGH_WAV_SUBTYPES = {'PCM_16', 'PCM_24', 'PCM_32', 'FLOAT'}
+
+# VU publisher tick (20 Hz). Each client has its own writer task, so a slow client only
+# delays itself; one whose send is stuck longer than the stall timeout is closed.
+_VU_INTERVAL = 0.05
+_VU_STALL_TIMEOUT = 2.0
+# Upper bound on concurrent VU websocket clients; further connections are refused (close 1013)
+_VU_MAX_CLIENTS = int(os.environ.get("BULLEN_MAX_WS_CLIENTS", "64"))
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for NumPy arrays/scalars when orjson is not installed."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumpb(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes, using orjson (NumPy-aware) when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def _json_body(request: Request) -> Dict[str, Any]:
+    """
+    Read a JSON object body directly (skips FastAPI's body parsing/validation pipeline).
+    
+    Raises:
+        HTTPException: If the body is not a JSON object
+    """
+    return _parse_json_object(await request.body())
+
+
+def _parse_json_object(body: bytes) -> Dict[str, Any]:
+    """
+    Decode a request body that must be a JSON object (empty body -> {}).
+    
+    Raises:
+        HTTPException: If the body is not a JSON object
+    """
+    try:
+        payload = _loads(body) if body else {}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Expected a JSON object")
+    return payload
+
+
+def _vu_db_i8(values: Any) -> List[int]:
+    """Quantize linear VU levels to whole dB in int8 range; -127 means silence."""
+    db = 20.0 * np.log10(np.maximum(np.asarray(values, dtype=np.float32), 1e-7))
+    return np.clip(np.rint(db), -127, 127).astype(np.int8).tolist()
+
+
+def _gain_db_x10(values: Any) -> List[int]:
+    """Quantize gains in dB to 0.1 dB fixed-point integers."""
+    return np.rint(np.asarray(values, dtype=np.float32) * 10.0).astype(np.int16).tolist()
+
+
+def _list_delta(new: List[int], old: List[int]) -> Any:
+    """
+    Encode a changed per-channel list for a delta frame.
+    
+    Returns:
+        Any: {index: value} for the changed channels when fewer than half changed, else the full list
+    """
+    changed = {i: v for i, (v, o) in enumerate(zip(new, old)) if v != o}
+    return changed if len(changed) * 2 < len(new) else new
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a JSON text frame."""
+    return _dumpb(obj).decode()
+
+
+def _convert_upload_to_mono(src: Any, suffix: str, output_path: Path) -> Tuple[float, int]:
+    """
+    Save an uploaded file object to a temp file and convert it to a mono WAV (blocking).
+    Mono WAV uploads are moved into place as-is.
+    
+    Args:
+        src: Readable binary file object with the uploaded data
+        suffix: Original file extension, used so libsndfile can detect the format
+        output_path: Destination WAV path
+        
+    Returns:
+        Tuple[float, int]: Duration in seconds and sample rate
+    """
+    fd, temp_name = tempfile.mkstemp(suffix=suffix)
+    temp_path = Path(temp_name)
+    try:
+        # Save uploaded file to temporary location in 1 MiB chunks (fewer read/write calls
+        # than copyfileobj's 64 KiB default for multi-MB uploads)
+        with os.fdopen(fd, "wb") as temp_file:
+            shutil.copyfileobj(src, temp_file, _UPLOAD_COPY_CHUNK)
+        # Already a mono WAV in a sample format the feeders read: install it as uploaded
+        info = sf.info(str(temp_path))
+        if info.format == 'WAV' and info.channels == 1 and info.subtype in _PASSTHROUGH_WAV_SUBTYPES:
+            shutil.move(str(temp_path), str(output_path))
+            # mkstemp files are owner-only; match the permissions of converted uploads
+            os.chmod(output_path, 0o644)
+            return info.frames / info.samplerate, info.samplerate
+        # Read audio file as float32 (half the memory of the float64 default) and convert to mono WAV
+        data, samplerate = sf.read(str(temp_path), dtype='float32')
+        # Convert to mono if multi-channel; mono files are written as read
+        if data.ndim > 1:
+            if data.shape[1] == 2:
+                # Stereo (the common case): elementwise add + scale instead of an axis reduction
+                mono = np.add(data[:, 0], data[:, 1])
+                mono *= np.float32(0.5)
+                data = mono
+            else:
+                data = np.mean(data, axis=1, dtype=np.float32)
+        sf.write(str(output_path), data, samplerate, subtype='PCM_16')
+    finally:
+        # Clean up temp file
+        temp_path.unlink(missing_ok=True)
+    return len(data) / samplerate, samplerate
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available (default response class of the app)."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumpb(content)
+
 
 def create_app(engine: Any) -> FastAPI:
     """
@@ -32,21 +208,31 @@ def create_app(engine: Any) -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application
     """
-    # Create FastAPI app with title
-    app = FastAPI(title="Bullen Audio Router")
+    # Create FastAPI app with title; JSON responses are rendered with orjson
+    app = FastAPI(title="Bullen Audio Router", default_response_class=FastJSONResponse)
 
     # Mount static files directory for UI
-    ui_dir = Path(__file__).resolve().parents[1] / "ui"
-    app.mount("/ui", StaticFiles(directory=str(ui_dir), html=True), name="ui")
+    app.mount("/ui", StaticFiles(directory=str(_UI_DIR), html=True), name="ui")
 
     # Store engine and initialize app state
     app.state.engine = engine
-    app.state.clients: Set[WebSocket] = set()
+    # Connected VU clients as (websocket, mailbox) pairs; the mailbox holds at most one pending
+    # frame for that client's writer task. Replaced (copy-on-write) on connect/disconnect so the
+    # publisher can iterate the current list every tick without copying it. Held in closure
+    # variables rather than app.state to keep attribute lookups off the 20 Hz path.
+    vu_clients: List[Tuple[WebSocket, asyncio.Queue]] = []
+    # Set while at least one VU client is connected; the publisher idles on it otherwise
+    vu_has_clients = asyncio.Event()
     app.state.vu_task = None
+    # VU websocket connections refused because _VU_MAX_CLIENTS was reached
+    app.state.ws_rejected_total = 0
     app.state.feed_procs: Dict[int, Any] = {}
 
     # -------- Helpers --------
 
+    # Error detail for out-of-range channels (fixed once the engine is known)
+    channel_range_detail = f"Channel out of range (1..{engine.num_inputs})"
+
     def _validate_channel(ch: int) -> int:
         """
         Validate that a channel number is within the allowed range.
@@ -62,7 +248,7 @@ def create_app(engine: Any) -> FastAPI:
         """
         # Check if channel number is valid
         if not 1 <= ch <= engine.num_inputs:
-            raise HTTPException(status_code=400, detail=f"Channel out of range (1..{engine.num_inputs})")
+            raise HTTPException(status_code=400, detail=channel_range_detail)
         # Return 0-based index
         return ch - 1
 
@@ -93,17 +279,18 @@ def create_app(engine: Any) -> FastAPI:
                 state['scene_confidence'] = engine.advanced_processors['scene'].scene_confidence
                 
                 # Adaptive processing metrics
+                # (NumPy arrays are serialized directly by FastJSONResponse, no tolist() round trip)
                 adaptive = engine.advanced_processors['adaptive']
-                state['adaptive_gains'] = adaptive.adaptive_gains.tolist()
-                state['noise_gates'] = adaptive.noise_gates.tolist()
-                state['compressor_ratios'] = adaptive.compressor_ratios.tolist()
+                state['adaptive_gains'] = adaptive.adaptive_gains
+                state['noise_gates'] = adaptive.noise_gates
+                state['compressor_ratios'] = adaptive.compressor_ratios
                 
                 # Telemetry
                 telemetry = engine.advanced_processors['telemetry']
                 state['health_score'] = telemetry.get_health_score()
                 state['xrun_count'] = telemetry.xrun_count
-                state['thd'] = telemetry.thd_measurements.tolist()
-                state['snr'] = telemetry.snr_measurements.tolist()
+                state['thd'] = telemetry.thd_measurements
+                state['snr'] = telemetry.snr_measurements
                 
                 # Buffer management
                 buffer_mgr = engine.advanced_processors['buffer_mgr']
@@ -111,13 +298,14 @@ def create_app(engine: Any) -> FastAPI:
                 
                 # Mixer weights
                 mixer = engine.advanced_processors['mixer']
-                state['mix_weights'] = mixer.mix_weights.tolist()
-                state['priority_scores'] = mixer.priority_scores.tolist()
+                state['mix_weights'] = mixer.mix_weights
+                state['priority_scores'] = mixer.priority_scores
                 
             except Exception as e:
                 logger.debug(f"Could not add advanced metrics: {e}")
         
-        return state
+        # Return a rendered response directly to skip FastAPI's jsonable_encoder pass
+        return FastJSONResponse(state)
 
     @app.post("/api/select/{ch}")
     def select_channel(ch: int):
@@ -134,62 +322,86 @@ def create_app(engine: Any) -> FastAPI:
         idx = _validate_channel(ch)
         # Set selected channel in engine
         engine.set_selected_channel(idx)
-        # Return success response
-        return {"ok": True, "selected_channel": ch}
+        # Return success response (bare Response: no encoder pass)
+        return Response(content=b'{"ok":true,"selected_channel":%d}' % ch, media_type="application/json")
 
     @app.post("/api/gain/{ch}")
-    async def set_gain(ch: int, payload: Dict[str, Any]):
+    async def set_gain(ch: int, request: Request):
         """
         Set gain for a specific channel.
         
         Args:
             ch (int): Channel number (1-based)
-            payload (Dict): Request payload containing gain values
+            request (Request): Request whose JSON body contains gain values
             
         Returns:
-            Dict: Success response
+            Response: Success response
         """
         # Validate and convert channel number to index
         idx = _validate_channel(ch)
-        # Set gain based on provided value type
+        body = await request.body()
+        # Fast path: single-key body sent by the UI slider
+        m = _GAIN_BODY_RE.fullmatch(body)
+        if m:
+            payload = {m.group(1).decode(): float(m.group(2))}
+        else:
+            payload = _parse_json_object(body)
         if "gain_db" in payload:
-            # Set gain in decibels
-            engine.set_gain_db(idx, float(payload["gain_db"]))
+            key = "gain_db"
         elif "gain_linear" in payload:
-            # Set gain in linear scale
-            engine.set_gain_linear(idx, float(payload["gain_linear"]))
+            key = "gain_linear"
         else:
             # Raise error if no valid gain value provided
             raise HTTPException(status_code=400, detail="Expected 'gain_db' or 'gain_linear'")
-        # Return success response
-        return {"ok": True}
+        # Both paths accept overflowing literals such as 1e999 (-> inf); never store a non-finite gain
+        try:
+            value = float(payload[key])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail=f"'{key}' must be a number")
+        if not math.isfinite(value):
+            raise HTTPException(status_code=400, detail=f"'{key}' must be finite")
+        # Set gain based on provided value type, clamped to the range the UI supports
+        if key == "gain_db":
+            engine.set_gain_db(idx, min(max(value, _GAIN_DB_MIN), _GAIN_DB_MAX))
+        else:
+            engine.set_gain_linear(idx, min(max(value, 0.0), _GAIN_LINEAR_MAX))
+        # Return success response (bare Response: no encoder pass)
+        return Response(content=_OK_BODY, media_type="application/json")
 
     @app.post("/api/mute/{ch}")
-    async def set_mute(ch: int, payload: Dict[str, Any]):
+    async def set_mute(ch: int, request: Request):
         """
         Set mute status for a specific channel.
         
         Args:
             ch (int): Channel number (1-based)
-            payload (Dict): Request payload containing mute status
+            request (Request): Request whose JSON body contains mute status
             
         Returns:
-            Dict: Success response
+            Response: Success response
         """
         # Validate and convert channel number to index
         idx = _validate_channel(ch)
-        # Check if mute value is provided
-        if "mute" not in payload:
-            raise HTTPException(status_code=400, detail="Expected 'mute': true/false")
+        body = await request.body()
+        # Fast path: single-key body sent by the UI button
+        m = _MUTE_BODY_RE.fullmatch(body)
+        if m:
+            mute = m.group(1) == b"true"
+        else:
+            payload = _parse_json_object(body)
+            # Check if mute value is provided
+            if "mute" not in payload:
+                raise HTTPException(status_code=400, detail="Expected 'mute': true/false")
+            mute = bool(payload["mute"])
         # Set mute status in engine
-        engine.set_mute(idx, bool(payload["mute"]))
-        # Return success response
-        return {"ok": True}
+        engine.set_mute(idx, mute)
+        # Return success response (bare Response: no encoder pass)
+        return Response(content=_OK_BODY, media_type="application/json")
 
     @app.get("/api/config")
     def get_config():
         """Get current configuration"""
-        return engine.config
+        return FastJSONResponse(engine.config)
 
     @app.post("/api/noise_suppression/aggressiveness")
     async def set_noise_suppression_aggressiveness(payload: Dict[str, float]):
@@ -204,17 +416,19 @@ def create_app(engine: Any) -> FastAPI:
     async def get_noise_suppression_status():
         """Get noise suppression status and configuration"""
         if hasattr(engine, 'noise_suppressor') and engine.noise_suppressor:
-            return {
+            return FastJSONResponse({
                 "enabled": True,
                 "aggressiveness": engine.noise_suppressor.aggressiveness,
                 "cross_channel_enabled": engine.noise_suppressor.enable_cross_channel,
                 "comfort_noise_level": engine.noise_suppressor.comfort_noise_level
-            }
-        return {"enabled": False}
+            })
+        return FastJSONResponse({"enabled": False})
     
     @app.get("/api/advanced/metrics")
     async def get_advanced_metrics():
-        """Get detailed advanced processing metrics"""
+        """Get detailed advanced processing metrics (polled by the UI telemetry panel)"""
+        # NumPy arrays are passed through as-is: the response class serializes them
+        # directly, skipping tolist() copies and FastAPI's jsonable_encoder pass
         metrics = {
             'enabled': engine.advanced_processing_enabled,
             'processors_available': False
@@ -225,15 +439,15 @@ def create_app(engine: Any) -> FastAPI:
             try:
                 # Detailed metrics from each processor
                 metrics['psychoacoustic'] = {
-                    'bark_bands': engine.advanced_processors['psychoacoustic'].bark_bands.tolist(),
-                    'masking_threshold': engine.advanced_processors['psychoacoustic'].masking_threshold.tolist()
+                    'bark_bands': engine.advanced_processors['psychoacoustic'].bark_bands,
+                    'masking_threshold': engine.advanced_processors['psychoacoustic'].masking_threshold
                 }
                 
                 adaptive = engine.advanced_processors['adaptive']
                 metrics['adaptive'] = {
-                    'gains': adaptive.adaptive_gains.tolist(),
-                    'noise_gates': adaptive.noise_gates.tolist(),
-                    'compressor_ratios': adaptive.compressor_ratios.tolist(),
+                    'gains': adaptive.adaptive_gains,
+                    'noise_gates': adaptive.noise_gates,
+                    'compressor_ratios': adaptive.compressor_ratios,
                     'stats': [
                         {
                             'rms': s.rms,
@@ -249,10 +463,10 @@ def create_app(engine: Any) -> FastAPI:
                 
                 mixer = engine.advanced_processors['mixer']
                 metrics['mixer'] = {
-                    'mix_weights': mixer.mix_weights.tolist(),
-                    'target_weights': mixer.target_weights.tolist(),
-                    'priority_scores': mixer.priority_scores.tolist(),
-                    'correlation_matrix': mixer.correlation_matrix.tolist()
+                    'mix_weights': mixer.mix_weights,
+                    'target_weights': mixer.target_weights,
+                    'priority_scores': mixer.priority_scores,
+                    'correlation_matrix': mixer.correlation_matrix
                 }
                 
                 scene = engine.advanced_processors['scene']
@@ -269,8 +483,8 @@ def create_app(engine: Any) -> FastAPI:
                 metrics['telemetry'] = {
                     'health_score': telemetry.get_health_score(),
                     'xrun_count': telemetry.xrun_count,
-                    'thd': telemetry.thd_measurements.tolist(),
-                    'snr': telemetry.snr_measurements.tolist(),
+                    'thd': telemetry.thd_measurements,
+                    'snr': telemetry.snr_measurements,
                     'recent_xruns': len([t for t in telemetry.xrun_timestamps if t > time.time() - 60])
                 }
                 
@@ -278,13 +492,10 @@ def create_app(engine: Any) -> FastAPI:
                 metrics['error'] = str(e)
                 logger.error(f"Error getting advanced metrics: {e}")
         
-        return metrics
+        return FastJSONResponse(metrics)
 
     # -------- Tools: WAV generation and WAV feed --------
 
-    def _project_root() -> Path:
-        return Path(__file__).resolve().parents[2]
-
     @app.post("/api/tools/generate_wavs")
     def api_generate_wavs(payload: Dict[str, Any] | None = None):
         """
@@ -295,7 +506,7 @@ def create_app(engine: Any) -> FastAPI:
         seconds = float(payload.get("seconds", 2.0))
         samplerate = int(payload.get("samplerate", 48000))
         outdir = payload.get("outdir", "test_wavs")
-        root = _project_root()
+        root = _PROJECT_ROOT
         out = (root / outdir).resolve()
 
         # Distinct frequencies per channel (6 inputs default)
@@ -308,47 +519,104 @@ def create_app(engine: Any) -> FastAPI:
             files.append(str(path.relative_to(root)))
         return {"ok": True, "files": files, "outdir": str(out.relative_to(root))}
 
+    # Listing of test_wavs/ keyed on the directory mtime (adding/removing files bumps it)
+    wavs_cache: Dict[str, Any] = {"mtime": None, "result": {"files": {}}}
+
     @app.get("/api/tools/wavs")
     def api_list_wavs():
         """List available generated test WAVs in 'test_wavs/' directory."""
-        root = _project_root()
-        base = root / "test_wavs"
+        base = _TEST_WAVS_DIR
+        try:
+            mtime = base.stat().st_mtime_ns
+        except OSError:
+            return {"files": {}}
+        if mtime == wavs_cache["mtime"]:
+            return wavs_cache["result"]
+
+        # Single directory scan, bucketed by input number
         mapping: Dict[int, List[str]] = {}
-        if base.exists():
-            for idx in range(1, engine.num_inputs + 1):
-                files = sorted([str(p.relative_to(root)) for p in base.glob(f"ch{idx}_*.wav")])
-                if files:
-                    mapping[idx] = files
-        return {"files": mapping}
+        with os.scandir(base) as it:
+            for entry in it:
+                m = _TEST_WAV_RE.fullmatch(entry.name)
+                if m and 1 <= int(m.group(1)) <= engine.num_inputs:
+                    mapping.setdefault(int(m.group(1)), []).append(f"test_wavs/{entry.name}")
+        for files in mapping.values():
+            files.sort()
+        wavs_cache["mtime"] = mtime
+        wavs_cache["result"] = {"files": dict(sorted(mapping.items()))}
+        return wavs_cache["result"]
+
+    # Decoded/resampled feed audio at unity gain keyed by (path, mtime_ns, samplerate), least
+    # recently used first; the engine applies each feed's gain, so channels playing the same
+    # file at any gain share one read-only buffer
+    wav_cache: Dict[tuple, Any] = {}
+    wav_cache_lock = threading.Lock()
+
+    def _load_feed_cached(wav_path: Path, samplerate: int):
+        """Load feed audio, reusing the decoded array while the file is unchanged."""
+        key = (str(wav_path), wav_path.stat().st_mtime_ns, samplerate)
+        with wav_cache_lock:
+            samples = wav_cache.pop(key, None)
+            if samples is not None:
+                wav_cache[key] = samples
+                return samples
+        samples = load_feed_audio(wav_path, samplerate)
+        if samples.nbytes <= _FEED_CACHE_MAX_BYTES:
+            with wav_cache_lock:
+                wav_cache[key] = samples
+                total = sum(a.nbytes for a in wav_cache.values())
+                # Evict least recently used entries until the decoded audio fits the budget
+                while total > _FEED_CACHE_MAX_BYTES:
+                    total -= wav_cache.pop(next(iter(wav_cache))).nbytes
+        return samples
 
     @app.post("/api/tools/feed/start")
-    def api_feed_start(payload: Dict[str, Any]):
+    async def api_feed_start(request: Request):
         """
-        Start feeding a WAV file into a given input via JACK using scripts/feed_wav_to_input.py.
+        Start feeding a WAV file into a given input. Engines that support it mix the audio
+        in-process (engine.start_feed); otherwise one scripts/feed_wav_to_input.py process
+        is started per input.
         Body: {file: str, input: int, loop?: bool, gain_db?: float}
         """
+        payload = await _json_body(request)
         if "file" not in payload or "input" not in payload:
             raise HTTPException(status_code=400, detail="Expected 'file' and 'input'")
         input_ch = int(payload["input"])
         if not 1 <= input_ch <= engine.num_inputs:
             raise HTTPException(status_code=400, detail=f"Input out of range (1..{engine.num_inputs})")
-        root = _project_root()
+        root = _PROJECT_ROOT
         wav_path = (root / payload["file"]).resolve()
         if not wav_path.exists():
             raise HTTPException(status_code=400, detail=f"File not found: {wav_path}")
-        scripts_dir = root / "scripts"
-        script_path = scripts_dir / "feed_wav_to_input.py"
-        if not script_path.exists():
-            raise HTTPException(status_code=500, detail="feed_wav_to_input.py not found")
 
-        # Stop any existing feeder on this input
-        old = app.state.feed_procs.get(input_ch)
+        # Stop any existing per-input feeder process on this input
+        old = app.state.feed_procs.pop(input_ch, None)
         if old and getattr(old, "poll", lambda: None)() is None:
             try:
                 old.terminate()
             except Exception:
                 pass
 
+        loop = bool(payload.get("loop", True))
+        gain_db = float(payload.get("gain_db", 0.0))
+
+        # Preferred path: decode once off the event loop and let the engine mix it in its RT callback
+        if hasattr(engine, "start_feed"):
+            try:
+                samplerate = int(engine.get_state()["samplerate"])
+                samples = await asyncio.to_thread(_load_feed_cached, wav_path, samplerate)
+                engine.start_feed(input_ch - 1, samples, loop, db_to_linear(gain_db))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to start feeder: {e}")
+            # No feeder process: report the mode instead of a pid (the server's own pid must
+            # not be mistaken for a feeder that may be killed)
+            return {"ok": True, "pid": None, "mode": "in_process", "input": input_ch}
+
+        # Fallback: dedicated feeder process for this input
+        script_path = _SCRIPTS_DIR / "feed_wav_to_input.py"
+        if not script_path.exists():
+            raise HTTPException(status_code=500, detail="feed_wav_to_input.py not found")
+
         client_name = f"bullen_wav_feed_ui_{input_ch}"
         cmd = [
             sys.executable,
@@ -360,7 +628,7 @@ def create_app(engine: Any) -> FastAPI:
             "--client_name",
             client_name,
         ]
-        if bool(payload.get("loop", True)):
+        if loop:
             cmd.append("--loop")
         if "gain_db" in payload:
             cmd.extend(["--gain_db", str(float(payload["gain_db"]))])
@@ -373,25 +641,34 @@ def create_app(engine: Any) -> FastAPI:
         return {"ok": True, "pid": getattr(proc, "pid", None), "input": input_ch}
 
     @app.post("/api/tools/feed/stop")
-    def api_feed_stop(payload: Dict[str, Any]):
+    async def api_feed_stop(request: Request):
         """Stop feeder for given input. Body: {input: int}"""
+        payload = await _json_body(request)
         if "input" not in payload:
             raise HTTPException(status_code=400, detail="Expected 'input'")
         input_ch = int(payload["input"])
-        proc = app.state.feed_procs.get(input_ch)
-        if not proc:
-            return {"ok": True, "stopped": False}
-        try:
-            proc.terminate()
-        except Exception:
-            pass
-        app.state.feed_procs.pop(input_ch, None)
-        return {"ok": True, "stopped": True}
+        stopped = False
+        if hasattr(engine, "stop_feed") and 1 <= input_ch <= engine.num_inputs:
+            # In-process feed: takes effect on the next JACK period
+            stopped = engine.stop_feed(input_ch - 1)
+        proc = app.state.feed_procs.pop(input_ch, None)
+        if proc:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+            stopped = True
+        return {"ok": True, "stopped": stopped}
 
     @app.get("/api/tools/feed/status")
     def api_feed_status():
-        """Return running feeder processes keyed by input channel."""
+        """Return running feeders keyed by input channel."""
         status = {}
+        if hasattr(engine, "active_feeds"):
+            for idx in engine.active_feeds():
+                status[idx + 1] = {"pid": None, "mode": "in_process", "alive": True}
+        # Per-input fallback processes are polled individually: a SIGCHLD/waitpid(-1) reaper
+        # would also reap the children that subprocess.run() waits for in the test endpoints
         for ch, proc in list(app.state.feed_procs.items()):
             alive = getattr(proc, "poll", lambda: None)() is None
             status[ch] = {"pid": getattr(proc, "pid", None), "alive": alive}
@@ -401,6 +678,10 @@ def create_app(engine: Any) -> FastAPI:
 
     # -------- Audio File Upload --------
 
+    # Upload listing keyed on the uploads directory mtime (entries are only added/removed,
+    # never rewritten in place); the upload handler also resets it once a file is complete
+    uploads_cache: Dict[str, Any] = {"mtime": None, "result": {"files": []}}
+
     @app.post("/api/upload/audio")
     async def upload_audio_file(file: UploadFile = File(...)):
         """
@@ -423,8 +704,8 @@ def create_app(engine: Any) -> FastAPI:
             )
         
         # Create uploads directory
-        root = _project_root()
-        uploads_dir = root / "uploads"
+        root = _PROJECT_ROOT
+        uploads_dir = _UPLOADS_DIR
         uploads_dir.mkdir(exist_ok=True)
         
         # Generate unique filename
@@ -434,26 +715,10 @@ def create_app(engine: Any) -> FastAPI:
         output_path = uploads_dir / output_filename
         
         try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-                shutil.copyfileobj(file.file, temp_file)
-                temp_path = temp_file.name
-            
-            # Read audio file and convert to mono WAV
-            data, samplerate = sf.read(temp_path)
-            
-            # Convert to mono if stereo
-            if len(data.shape) > 1:
-                data = data.mean(axis=1)
-            
-            # Write as mono WAV
-            sf.write(str(output_path), data, samplerate)
-            
-            # Clean up temp file
-            Path(temp_path).unlink()
-            
-            # Get file info
-            duration = len(data) / samplerate
+            # Copy/decode/encode in a worker thread so VU updates and other requests keep running
+            duration, samplerate = await asyncio.to_thread(_convert_upload_to_mono, file.file, file_ext, output_path)
+            # A listing taken while the file was still being written must not stay cached
+            uploads_cache["mtime"] = None
             
             return {
                 "filename": output_filename,
@@ -466,8 +731,6 @@ def create_app(engine: Any) -> FastAPI:
             
         except Exception as e:
             # Clean up on error
-            if 'temp_path' in locals():
-                Path(temp_path).unlink(missing_ok=True)
             output_path.unlink(missing_ok=True)
             raise HTTPException(status_code=500, detail=f"Error processing audio file: {str(e)}")
 
@@ -479,26 +742,28 @@ def create_app(engine: Any) -> FastAPI:
         Returns:
             JSON response with list of uploaded files
         """
-        root = _project_root()
-        uploads_dir = root / "uploads"
+        root = _PROJECT_ROOT
+        uploads_dir = _UPLOADS_DIR
         
-        if not uploads_dir.exists():
+        try:
+            mtime = uploads_dir.stat().st_mtime_ns
+        except OSError:
             return {"files": []}
+        if mtime == uploads_cache["mtime"]:
+            return uploads_cache["result"]
         
         files = []
         for wav_file in uploads_dir.glob("*.wav"):
             try:
-                # Get audio file info
-                data, samplerate = sf.read(str(wav_file))
-                duration = len(data) / samplerate
-                channels = 1 if len(data.shape) == 1 else data.shape[1]
+                # Get audio file info from the header only (no sample data is decoded)
+                info = sf.info(str(wav_file))
                 
                 files.append({
                     "filename": wav_file.name,
                     "path": str(wav_file.relative_to(root)),
-                    "duration": duration,
-                    "samplerate": samplerate,
-                    "channels": channels
+                    "duration": info.frames / info.samplerate,
+                    "samplerate": info.samplerate,
+                    "channels": info.channels
                 })
             except Exception:
                 # Skip files that can't be read
@@ -506,9 +771,11 @@ def create_app(engine: Any) -> FastAPI:
         
         # Sort by filename
         files.sort(key=lambda x: x["filename"])
-        return {"files": files}
+        uploads_cache["mtime"] = mtime
+        uploads_cache["result"] = {"files": files}
+        return uploads_cache["result"]
 
-    @app.delete("/api/upload/{filename}")
+    @app.delete("/api/upload/{filename:path}")
     def delete_uploaded_file(filename: str):
         """
         Delete an uploaded audio file.
@@ -519,22 +786,18 @@ def create_app(engine: Any) -> FastAPI:
         Returns:
             JSON response confirming deletion
         """
-        root = _project_root()
-        uploads_dir = root / "uploads"
-        file_path = uploads_dir / filename
-        
-        # Security check - ensure file is in uploads directory
-        try:
-            file_path.resolve().relative_to(uploads_dir.resolve())
-        except ValueError:
+        # Security check - a single WAV name without separators can only refer to an entry
+        # directly inside the uploads directory (no path resolution needed). The route takes
+        # a full path so names with encoded '/' are rejected here (400) rather than by routing.
+        if not _UPLOAD_NAME_RE.fullmatch(filename):
             raise HTTPException(status_code=400, detail="Invalid file path")
-        
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="File not found")
+        file_path = _UPLOADS_DIR / filename
         
         try:
             file_path.unlink()
             return {"ok": True, "deleted": filename}
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error deleting file: {str(e)}")
 
@@ -554,7 +817,7 @@ def create_app(engine: Any) -> FastAPI:
             import sys
             
             # Get the script path
-            script_path = _project_root() / "scripts" / "audio_output_test.py"
+            script_path = _SCRIPTS_DIR / "audio_output_test.py"
             
             if not script_path.exists():
                 raise HTTPException(status_code=500, detail="Audio test script not found")
@@ -591,7 +854,7 @@ def create_app(engine: Any) -> FastAPI:
             import subprocess
             import sys
             
-            script_path = _project_root() / "scripts" / "audio_output_test.py"
+            script_path = _SCRIPTS_DIR / "audio_output_test.py"
             
             if not script_path.exists():
                 raise HTTPException(status_code=500, detail="Audio test script not found")
@@ -604,7 +867,7 @@ def create_app(engine: Any) -> FastAPI:
             
             if result.returncode == 0:
                 # List generated files
-                test_dir = _project_root() / "scripts" / "output_test_audio"
+                test_dir = _SCRIPTS_DIR / "output_test_audio"
                 files = []
                 if test_dir.exists():
                     files = [f.name for f in test_dir.glob("*.wav")]
@@ -637,57 +900,129 @@ def create_app(engine: Any) -> FastAPI:
         """
         # Accept WebSocket connection
         await ws.accept()
-        # Add connection to clients set
-        app.state.clients.add(ws)
+        nonlocal vu_clients
+        if len(vu_clients) >= _VU_MAX_CLIENTS:
+            # Full: refuse with 1013 (try again later) instead of slowing down every client.
+            # Closed after accept, since a close before the handshake reaches the client as HTTP 403.
+            app.state.ws_rejected_total += 1
+            logger.warning("VU websocket refused: %d clients connected (rejected total: %d)",
+                           len(vu_clients), app.state.ws_rejected_total)
+            await ws.close(code=1013)
+            return
+        # Add connection to clients list, with a one-frame mailbox drained by its own writer
+        mailbox: asyncio.Queue = asyncio.Queue(maxsize=1)
+        writer = asyncio.create_task(_vu_writer(ws, mailbox))
+        vu_clients = vu_clients + [(ws, mailbox)]
+        vu_has_clients.set()
         try:
-            # Keep open until client disconnects
+            # Keep open until client disconnects; incoming messages (pings) are ignored
             while True:
-                try:
-                    # Wait for messages (to keep connection alive)
-                    await ws.receive_text()
-                except Exception:
-                    # Sleep to prevent busy loop
-                    await asyncio.sleep(1)
+                message = await ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
         except WebSocketDisconnect:
             # Handle client disconnection
             pass
+        except Exception as e:
+            # Broken transport: drop the client instead of polling it
+            logger.debug("VU websocket closed on error: %s", e)
         finally:
-            # Remove connection from clients set
-            app.state.clients.discard(ws)
+            # Remove connection from clients list and stop its writer
+            _remove_client(ws)
+            writer.cancel()
+
+    def _remove_client(ws: WebSocket):
+        """
+        Drop a connection from the clients list (publishes a new list).
+        """
+        nonlocal vu_clients
+        vu_clients = [c for c in vu_clients if c[0] is not ws]
+        if not vu_clients:
+            vu_has_clients.clear()
+
+    async def _vu_writer(ws: WebSocket, mailbox: asyncio.Queue):
+        """
+        Send frames from a client's mailbox until the connection fails or stalls.
+        """
+        try:
+            while True:
+                message = await mailbox.get()
+                await asyncio.wait_for(ws.send(message), timeout=_VU_STALL_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Broken or stalled transport: close it so vu_socket ends and the UI reconnects
+            logger.debug("VU websocket send failed: %s", e)
+            await _close_quietly(ws)
+
+    async def _close_quietly(ws: WebSocket):
+        """
+        Close a WebSocket connection, ignoring errors from an already broken transport.
+        """
+        with contextlib.suppress(Exception):
+            await ws.close()
 
     async def _vu_publisher():
         """
         Publish VU meter updates to all connected WebSocket clients.
         """
+        # Engines with get_vu_state() return just the published fields, skipping the full
+        # get_state() (gains_linear, recording counters, list conversions) every tick
+        read_vu_state = getattr(engine, "get_vu_state", engine.get_state)
+        # Last published payload and the client list it was sent to
+        last_payload = None
+        last_clients = None
         try:
             while True:
+                # Sleep without waking up while no clients are connected
+                await vu_has_clients.wait()
                 # 20 Hz updates (50ms interval)
-                await asyncio.sleep(0.05)
-                # Skip if no clients connected
-                if not app.state.clients:
+                await asyncio.sleep(_VU_INTERVAL)
+                # Skip if the last client left during the sleep
+                if not vu_clients:
                     continue
                 # Get current engine state only when there are clients
-                state = engine.get_state()
-                # Prepare payload for VU meter updates
+                state = read_vu_state()
+                # Compact payload (decoded by ui/js/ws.js): VU in whole dB, gains in 0.1 dB, mutes as 0/1
                 payload = {
-                    "vu_peak": state["vu_peak"],
-                    "vu_rms": state["vu_rms"],
-                    "selected_channel": state["selected_channel"],
-                    "mutes": state["mutes"],
-                    "gains_db": state["gains_db"],
+                    "p": _vu_db_i8(state["vu_peak"]),
+                    "r": _vu_db_i8(state["vu_rms"]),
+                    "s": state["selected_channel"],
+                    "m": [int(m) for m in state["mutes"]],
+                    "g": _gain_db_x10(state["gains_db"]),
                 }
-                # Track dead connections
-                dead = []
-                # Send updates to all clients
-                for ws in list(app.state.clients):
+                clients = vu_clients
+                if clients is not last_clients:
+                    # Clients (re)connected or left: send the full frame so new ones get every field
+                    frame = payload
+                elif payload == last_payload:
+                    # Nothing changed since the last send
+                    continue
+                else:
+                    # Delta frame: only the fields that changed, and for per-channel lists only the
+                    # channels that changed (ws.js merges it into the last state)
+                    frame = {}
+                    for k, v in payload.items():
+                        old = last_payload[k]
+                        if v != old:
+                            frame[k] = _list_delta(v, old) if isinstance(v, list) else v
+                # Serialize once per tick and hand the same pre-framed message to every client
+                message = {"type": "websocket.send", "text": _dumps(frame)}
+                full_message = message if frame is payload else None
+                last_payload = payload
+                last_clients = clients
+                # Never await a client here: post to each mailbox, replacing a frame the writer
+                # has not picked up yet (drop-oldest keeps memory bounded on slow links)
+                for _, mailbox in clients:
                     try:
-                        await ws.send_json(payload)
-                    except Exception:
-                        # Mark connection as dead if sending fails
-                        dead.append(ws)
-                # Remove dead connections
-                for ws in dead:
-                    app.state.clients.discard(ws)
+                        mailbox.put_nowait(message)
+                    except asyncio.QueueFull:
+                        # The dropped frame may hold changes this delta does not repeat,
+                        # so a lagging client gets the full current state instead
+                        if full_message is None:
+                            full_message = {"type": "websocket.send", "text": _dumps(payload)}
+                        mailbox.get_nowait()
+                        mailbox.put_nowait(full_message)
         except asyncio.CancelledError:
             # Handle task cancellation
             pass
@@ -696,6 +1031,11 @@ def create_app(engine: Any) -> FastAPI:
     async def lifespan(app: FastAPI):
         # Startup: start engine and VU publisher
         engine.start()
+        # Bind a fresh event to this server's loop, reflecting clients connected so far
+        nonlocal vu_has_clients
+        vu_has_clients = asyncio.Event()
+        if vu_clients:
+            vu_has_clients.set()
         app.state.vu_task = asyncio.create_task(_vu_publisher())
         try:
             yield
@@ -1,6 +1,8 @@
+import functools
 import os
 import uvicorn
 import logging
+from typing import Optional
 
 from app.config import load_config
 from app.server.app import create_app
@@ -19,22 +21,31 @@ logging.getLogger('dbus.proxies').setLevel(logging.ERROR)
 os.environ.setdefault('DBUS_SESSION_BUS_ADDRESS', 'unix:path=/dev/null')
 
 
+@functools.lru_cache(maxsize=1)
+def _board_model() -> Optional[str]:
+    """Board model string from the device tree (read once per process), or None if absent."""
+    try:
+        with open("/proc/device-tree/model", "r", errors="ignore") as f:
+            # Device-tree strings are NUL terminated
+            return f.read().strip().rstrip("\x00")
+    except FileNotFoundError:
+        return None
+
+
 def _ensure_raspberry_pi():
     """Ensure we're running on a Raspberry Pi (unless override set)."""
     if os.environ.get("BULLEN_ALLOW_NON_PI"):
         logging.info("Running in development mode (FakeEngine)")
         return False
-    try:
-        with open("/proc/device-tree/model", "r") as f:
-            model = f.read().strip()
-        if "Raspberry Pi" not in model:
-            raise RuntimeError(f"Not a Raspberry Pi: {model}")
-        logging.info(f"Running on: {model}")
-        return True
-    except FileNotFoundError:
+    model = _board_model()
+    if model is None:
         if os.name == 'nt':  # Windows
             logging.warning("Windows detected - use BULLEN_ALLOW_NON_PI=1 for development")
         raise RuntimeError("Not a Raspberry Pi: /proc/device-tree/model not found")
+    if "Raspberry Pi" not in model:
+        raise RuntimeError(f"Not a Raspberry Pi: {model}")
+    logging.info(f"Running on: {model}")
+    return True
 
 
 def _create_engine(config):
@@ -78,5 +89,11 @@ if __name__ == "__main__":
     host = os.environ.get("BULLEN_HOST", "0.0.0.0")
     # Get port from environment variable or default to 8000
     port = int(os.environ.get("BULLEN_PORT", "8000"))
+    # Prefer uvloop for the VU publisher/WebSocket event loop when it is installed (not on Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
     # Start uvicorn server with the FastAPI app
-    uvicorn.run("app.server.main:app", host=host, port=port, reload=False, workers=1)
+    uvicorn.run("app.server.main:app", host=host, port=port, reload=False, workers=1, loop=loop)
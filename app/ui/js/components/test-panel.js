@@ -160,7 +160,7 @@
       const r = await fetch('/api/tools/feed/start', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ file, input: ch, loop, gain_db: gain }) });
       const j = await r.json();
       if (!r.ok) throw new Error(JSON.stringify(j));
-      logTA(`Startade feed CH ${ch} (pid=${j.pid})`);
+      logTA(`Startade feed CH ${ch} (${j.pid ? `pid=${j.pid}` : j.mode})`);
     } catch (e) { logTA(`Fel vid start av feed: ${e}`); }
   }
 
@@ -278,7 +278,7 @@
     try {
       const response = await fetch('/api/tools/feed/start', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ file: file.path, input: channel, loop, gain_db: gain }) });
       const result = await response.json();
-      if (response.ok) logUpload(`▶ Spelar "${file.filename}" på kanal ${channel} (PID: ${result.pid})`);
+      if (response.ok) logUpload(`▶ Spelar "${file.filename}" på kanal ${channel} (${result.pid ? `PID: ${result.pid}` : result.mode})`);
       else logUpload(`Fel: ${result.detail}`);
     } catch (error) { logUpload(`Fel vid uppspelning: ${error.message}`); }
   }
@@ -3,11 +3,40 @@
 // onStatus receives: 'connected' | 'reconnecting' | 'error'
 
 (function(){
+  // Server sends compact VU frames: { p, r } = peak/RMS in whole dB (-127 = silence),
+  // s = selected channel, m = mutes as 0/1, g = gains in 0.1 dB. Expand to the
+  // long form the UI components use ({ vu_peak, vu_rms, selected_channel, mutes, gains_db }).
+  // The first frame on a connection is complete; later frames only carry the fields that
+  // changed, so missing fields are taken from the previous decoded state (prev). A list
+  // field may also arrive as { index: value } holding only the channels that changed.
+  function dbToLin(db){ return db <= -127 ? 0 : Math.pow(10, db / 20); }
+
+  function expand(v, prevList, fn) {
+    if (v === undefined) return prevList;
+    if (Array.isArray(v)) return v.map(fn);
+    const out = prevList.slice();
+    for (const k in v) out[+k] = fn(v[k]);
+    return out;
+  }
+
+  function decode(data, prev) {
+    if (!data || typeof data !== 'object') return data;
+    prev = prev || {};
+    return {
+      vu_peak: expand(data.p, prev.vu_peak, dbToLin),
+      vu_rms: expand(data.r, prev.vu_rms, dbToLin),
+      selected_channel: data.s !== undefined ? data.s : prev.selected_channel,
+      mutes: expand(data.m, prev.mutes, Boolean),
+      gains_db: expand(data.g, prev.gains_db, (g) => g / 10),
+    };
+  }
+
   function connect({ onMessage, onStatus } = {}) {
     const proto = location.protocol === 'https:' ? 'wss' : 'ws';
     const url = `${proto}://${location.host}/ws/vu`;
     let ws = new WebSocket(url);
     let pingTimer = null;
+    let last = null;
 
     function setStatus(s){ try { onStatus && onStatus(s); } catch(_){} }
 
@@ -18,7 +47,7 @@
 
     ws.onmessage = (ev) => {
       try {
-        const data = JSON.parse(ev.data);
+        const data = last = decode(JSON.parse(ev.data), last);
         onMessage && onMessage(data);
       } catch(_){}
     };
@@ -37,5 +66,5 @@
     return ws;
   }
 
-  window.BullenWS = { connect };
+  window.BullenWS = { connect, decode };
 })();
@@ -4,18 +4,115 @@ Audio Output Test Script for Bullen Audio Router
 Automatically tests all 8 output channels with clear, audible tones
 """
 
+import functools
+import io
+import json
 import sys
+import threading
 import time
+import uuid
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import requests
 
+try:
+    import orjson  # Faster JSON for the request/response bodies
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# requests.Session is not thread-safe: each thread gets its own (connection reuse stays per thread)
+_session_local = threading.local()
+_sessions: List[requests.Session] = []
+_sessions_lock = threading.Lock()
+
+
+def _thread_session() -> requests.Session:
+    """HTTP session owned by the calling thread."""
+    session = getattr(_session_local, 'session', None)
+    if session is None:
+        session = _session_local.session = requests.Session()
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+def _close_sessions() -> None:
+    """Close the sessions created by _thread_session() in any thread."""
+    with _sessions_lock:
+        sessions = _sessions[:]
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+    _session_local.__dict__.pop('session', None)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _json_loads(response: requests.Response) -> Any:
+    """Decode a response body straight from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# One-period sine wavetable shared by all test tones, indexed by the top bits of a 32-bit phase
+_SINE_LUT_BITS = 12
+_SINE_LUT_SIZE = 1 << _SINE_LUT_BITS
+_SINE_LUT = np.sin(2 * np.pi * np.arange(_SINE_LUT_SIZE) / _SINE_LUT_SIZE).astype(np.float32)
+
+# Sample index ramp 0..n-1 shared by all tones; grown on demand, sliced (no copy) per call
+_SAMPLE_INDEX = np.arange(0, dtype=np.uint32)
+
+def _sample_index(n: int) -> np.ndarray:
+    global _SAMPLE_INDEX
+    if n > len(_SAMPLE_INDEX):
+        _SAMPLE_INDEX = np.arange(n, dtype=np.uint32)
+    return _SAMPLE_INDEX[:n]
+
+def _lut_index(n: int, frequency: float, samplerate: int) -> np.ndarray:
+    """Wavetable indices for n samples of a sine at frequency (no sin() per sample)."""
+    # Fixed-point oscillator: uint32 phase wraps once per cycle, its top bits are the index
+    inc = int(round(frequency / samplerate * 2**32)) & 0xFFFFFFFF
+    phase = _sample_index(n) * np.uint32(inc)
+    phase >>= 32 - _SINE_LUT_BITS
+    return phase
+
+@functools.lru_cache(maxsize=None)
+def _fade_ramp(fade_samples: int) -> np.ndarray:
+    """Read-only 0..1 fade-in ramp; reversed view is the fade-out."""
+    ramp = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+def _add_tone(out: np.ndarray, start: int, n_samples: int, frequency: float, samplerate: int,
+              amplitude: float) -> None:
+    """Mix an unfaded sine into out[start:start + n_samples] in place."""
+    seg = out[start:start + n_samples]
+    tone = _SINE_LUT[_lut_index(len(seg), frequency, samplerate)]
+    tone *= np.float32(amplitude)
+    seg += tone
+
+def _apply_fade(x: np.ndarray, samplerate: int) -> None:
+    """Apply 10 ms fade in/out to x in place to prevent clicks."""
+    fade_samples = int(0.01 * samplerate)  # 10ms fade
+    if len(x) > 2 * fade_samples:
+        ramp = _fade_ramp(fade_samples)
+        # Fade in
+        x[:fade_samples] *= ramp
+        # Fade out
+        x[-fade_samples:] *= ramp[::-1]
+
 def generate_test_tone(frequency: float, duration: float, samplerate: int = 48000, 
                       amplitude: float = 0.3) -> np.ndarray:
     """
@@ -30,19 +127,10 @@ def generate_test_tone(frequency: float, duration: float, samplerate: int = 4800
     Returns:
         Audio data as numpy array
     """
-    t = np.linspace(0, duration, int(samplerate * duration), False)
-    # Create sine wave with slight envelope to avoid clicks
-    tone = amplitude * np.sin(2 * np.pi * frequency * t)
-    
-    # Apply fade in/out to prevent clicks
-    fade_samples = int(0.01 * samplerate)  # 10ms fade
-    if len(tone) > 2 * fade_samples:
-        # Fade in
-        tone[:fade_samples] *= np.linspace(0, 1, fade_samples)
-        # Fade out
-        tone[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-    
-    return tone.astype(np.float32)
+    tone = _SINE_LUT[_lut_index(int(samplerate * duration), frequency, samplerate)]
+    tone *= np.float32(amplitude)
+    _apply_fade(tone, samplerate)
+    return tone
 
 def generate_channel_announcement(channel_num: int, duration: float = 1.0, 
                                 samplerate: int = 48000) -> np.ndarray:
@@ -79,27 +167,24 @@ def generate_channel_announcement(channel_num: int, duration: float = 1.0,
     total_samples = int(samplerate * duration)
     audio = np.zeros(total_samples, dtype=np.float32)
     
-    # Main tone (70% of duration)
+    # Main tone (70% of duration) plus harmonic for richness, mixed straight into the
+    # output and faded once together (the fade is linear, so this equals fading each tone)
     main_duration = duration * 0.7
-    main_tone = generate_test_tone(base_freq, main_duration, samplerate, 0.4)
-    audio[:len(main_tone)] += main_tone
-    
-    # Add harmonic for richness
-    harmonic_tone = generate_test_tone(base_freq * 2, main_duration, samplerate, 0.2)
-    audio[:len(harmonic_tone)] += harmonic_tone
+    main_samples = int(samplerate * main_duration)
+    _add_tone(audio, 0, main_samples, base_freq, samplerate, 0.4)
+    _add_tone(audio, 0, main_samples, base_freq * 2, samplerate, 0.2)
+    _apply_fade(audio[:main_samples], samplerate)
     
     # Add channel number as beeps (remaining 30% of duration)
     beep_start = int(main_duration * samplerate)
     beep_duration = 0.1  # 100ms per beep
     beep_gap = 0.05     # 50ms gap
     
-    for i in range(channel_num):
-        beep_start_sample = beep_start + int(i * (beep_duration + beep_gap) * samplerate)
-        beep_end_sample = beep_start_sample + int(beep_duration * samplerate)
-        
-        if beep_end_sample < total_samples:
-            beep_tone = generate_test_tone(880, beep_duration, samplerate, 0.3)
-            audio[beep_start_sample:beep_start_sample + len(beep_tone)] += beep_tone
+    # Every beep is the same tone; generate it once and add it at each start offset
+    beep_tone = generate_test_tone(880, beep_duration, samplerate, 0.3)
+    starts = beep_start + (np.arange(channel_num) * ((beep_duration + beep_gap) * samplerate)).astype(np.int64)
+    for start in starts[starts + beep_tone.size < total_samples]:
+        audio[start:start + beep_tone.size] += beep_tone
     
     return audio
 
@@ -120,22 +205,89 @@ def create_test_audio_files(output_dir: Path, samplerate: int = 48000) -> List[t
     
     print("Generating test audio files for output channel testing...")
     
+    duration = 3.0
     for output_channel in range(1, 9):
-        # Create distinctive audio for each output channel
-        audio_data = generate_channel_announcement(output_channel, duration=3.0, samplerate=samplerate)
-        
-        # Save as WAV file
         filename = f"output_test_ch{output_channel}.wav"
         filepath = output_dir / filename
-        sf.write(str(filepath), audio_data, samplerate)
+        
+        # The audio is deterministic: reuse a file from an earlier run if it matches
+        if filepath.exists():
+            try:
+                info = sf.info(str(filepath))
+                if info.samplerate == samplerate and info.frames == int(samplerate * duration):
+                    created_files.append((output_channel, filepath))
+                    print(f"  Reusing {filename} - Output Channel {output_channel} test audio")
+                    continue
+            except RuntimeError:
+                # Unreadable/corrupt file: regenerate below
+                pass
+        
+        # Create distinctive audio for each output channel
+        audio_data = generate_channel_announcement(output_channel, duration=duration, samplerate=samplerate)
+        
+        # Save as 16-bit WAV file (tones are far above the 16-bit noise floor), encoded in
+        # memory and written in one go
+        buf = io.BytesIO()
+        sf.write(buf, audio_data, samplerate, format='WAV', subtype='PCM_16')
+        filepath.write_bytes(buf.getbuffer())
         created_files.append((output_channel, filepath))
         
         print(f"  Created {filename} - Output Channel {output_channel} test audio")
     
     return created_files
 
+def _multipart_file_stream(field: str, path: Path, content_type: str,
+                           chunk_size: int = 64 * 1024) -> Tuple[Iterator[bytes], str]:
+    """
+    Build a streaming multipart/form-data body holding one file.
+    
+    requests reads a files= upload completely into memory to build the body; a generator
+    body is sent chunk by chunk instead (chunked transfer encoding).
+    
+    Returns:
+        Tuple of (body iterator, Content-Type header value)
+    """
+    boundary = uuid.uuid4().hex
+    
+    def body() -> Iterator[bytes]:
+        yield (f'--{boundary}\r\n'
+               f'Content-Disposition: form-data; name="{field}"; filename="{path.name}"\r\n'
+               f'Content-Type: {content_type}\r\n\r\n').encode()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        yield f'\r\n--{boundary}--\r\n'.encode()
+    
+    return body(), f'multipart/form-data; boundary={boundary}'
+
+def _upload_test_file(test_file: Path, server_url: str, http: Any) -> Optional[Dict[str, Any]]:
+    """
+    Upload one test file to the server.
+    
+    Returns:
+        Upload result (filename, path, ...) or None on failure
+    """
+    # Streamed, not read into memory first
+    print(f"  Uploading test file: {test_file.name}")
+    body, content_type = _multipart_file_stream('file', test_file, 'audio/wav')
+    try:
+        response = http.post(f"{server_url}/api/upload/audio", data=body,
+                             headers={'Content-Type': content_type})
+    except requests.RequestException as e:
+        print(f"    Failed to upload {test_file.name}: {e}")
+        return None
+    if not response.ok:
+        print(f"    Failed to upload {test_file.name}: {response.text}")
+        return None
+    return _json_loads(response)
+
 def test_output_channel(output_channel: int, test_file: Path, server_url: str = "http://localhost:8000",
-                       duration: float = 3.0) -> bool:
+                       duration: float = 3.0, session: Optional[requests.Session] = None,
+                       upload_result: Optional[Dict[str, Any]] = None,
+                       executor: Optional[ThreadPoolExecutor] = None) -> bool:
     """
     Test a specific output channel by playing distinctive audio through input channels.
     
@@ -147,22 +299,22 @@ def test_output_channel(output_channel: int, test_file: Path, server_url: str =
         test_file: Path to test audio file for this output
         server_url: Bullen server URL
         duration: How long to play the test
+        session: HTTP session of the calling thread (keeps one connection to the server across calls)
+        upload_result: Result of an earlier upload of test_file; the caller then owns its deletion
+        executor: Long-lived worker for overlapping the select request with the feed start;
+            without one the select is sent serially
     
     Returns:
         True if test was successful
     """
+    http = session or requests
     try:
-        # Upload the test file
-        print(f"  Uploading test file: {test_file.name}")
-        with open(test_file, 'rb') as f:
-            files = {'file': f}
-            response = requests.post(f"{server_url}/api/upload/audio", files=files)
-        
-        if not response.ok:
-            print(f"    Failed to upload: {response.text}")
+        # Upload the test file unless the caller already did
+        owns_upload = upload_result is None
+        if owns_upload:
+            upload_result = _upload_test_file(test_file, server_url, http)
+        if upload_result is None:
             return False
-        
-        upload_result = response.json()
         uploaded_filename = upload_result['filename']
         
         # Use input channel 1 for all tests (since audio routes to all outputs anyway)
@@ -175,20 +327,22 @@ def test_output_channel(output_channel: int, test_file: Path, server_url: str =
             "gain_db": 0
         }
         
-        response = requests.post(f"{server_url}/api/tools/feed/start", 
-                               json=playback_data,
-                               headers={'Content-Type': 'application/json'})
+        # Start the feed and select the input channel (routes to all 8 outputs). With an executor
+        # the two independent requests overlap; its worker keeps its own session across channels.
+        select_url = f"{server_url}/api/select/{input_channel}"
+        select_future = executor.submit(lambda: _thread_session().post(select_url)) if executor else None
+        response = http.post(f"{server_url}/api/tools/feed/start", data=_json_dumps(playback_data),
+                             headers=_JSON_HEADERS)
+        select_response = select_future.result() if select_future else http.post(select_url)
         
         if not response.ok:
             print(f"    Failed to start playback: {response.text}")
             return False
         
-        playback_result = response.json()
+        playback_result = _json_loads(response)
         print(f"    Playback started (PID: {playback_result.get('pid', 'unknown')})")
         
-        # Select the input channel (routes to all 8 outputs)
-        response = requests.post(f"{server_url}/api/select/{input_channel}")
-        if response.ok:
+        if select_response.ok:
             print(f"    Selected input channel {input_channel} → All 8 outputs (testing output {output_channel})")
         
         # Wait for playback duration
@@ -196,12 +350,12 @@ def test_output_channel(output_channel: int, test_file: Path, server_url: str =
         
         # Stop playback
         stop_data = {"input": input_channel}
-        response = requests.post(f"{server_url}/api/tools/feed/stop",
-                               json=stop_data,
-                               headers={'Content-Type': 'application/json'})
+        response = http.post(f"{server_url}/api/tools/feed/stop", data=_json_dumps(stop_data),
+                             headers=_JSON_HEADERS)
         
         # Clean up uploaded file
-        requests.delete(f"{server_url}/api/upload/{uploaded_filename}")
+        if owns_upload:
+            http.delete(f"{server_url}/api/upload/{uploaded_filename}")
         
         return True
         
@@ -239,11 +393,25 @@ def run_comprehensive_output_test(server_url: str = "http://localhost:8000",
     
     success_count = 0
     total_tests = 8  # We have 8 output channels to test
-    
-    for i, (output_channel, filename) in enumerate(test_files, 1):
+    # Connection pool for the serial requests of the run (this thread only)
+    session = _thread_session()
+    
+    # Uploads and deletes are independent per channel: run them in parallel, keep playback
+    # serial so each channel can be heard on its own. Workers use their own sessions.
+    with ThreadPoolExecutor(max_workers=len(test_files)) as pool:
+        uploads = list(pool.map(lambda item: _upload_test_file(item[1], server_url, _thread_session()),
+                                test_files))
+    
+    # One worker for the whole run overlaps each select with its feed start
+    select_pool = ThreadPoolExecutor(max_workers=1)
+    for i, ((output_channel, filename), upload_result) in enumerate(zip(test_files, uploads), 1):
         print(f"\n--- TEST {i}/8: Output Channel {output_channel} ---")
+        if upload_result is None:
+            print("   ❌ Test failed")
+            continue
         try:
-            success = test_output_channel(output_channel, filename, server_url, test_duration)
+            success = test_output_channel(output_channel, filename, server_url, test_duration, session,
+                                          upload_result, select_pool)
             if success:
                 success_count += 1
                 print("   ✅ Test completed successfully")
@@ -258,6 +426,15 @@ def run_comprehensive_output_test(server_url: str = "http://localhost:8000",
         
         print()
     
+    select_pool.shutdown()
+    
+    uploaded_names = [u['filename'] for u in uploads if u is not None]
+    if uploaded_names:
+        with ThreadPoolExecutor(max_workers=len(uploaded_names)) as pool:
+            list(pool.map(lambda name: _thread_session().delete(f"{server_url}/api/upload/{name}"),
+                          uploaded_names))
+    _close_sessions()
+    
     # Summary
     print("=" * 50)
     print("🎯 TEST SUMMARY")
@@ -3,7 +3,7 @@
 Feed a mono WAV file into a selected Bullen engine input via JACK.
 
 - Auto-connects to JACK port 'bullen:in_<N>' (N = --input)
-- Resamples to JACK samplerate if needed (simple linear)
+- Resamples to JACK samplerate if needed (polyphase FIR with SciPy, else linear)
 - Non-RT: audio buffer is preloaded to memory (intended for short test tones)
 
 Usage:
@@ -12,10 +12,12 @@ Stop with Ctrl+C.
 """
 from __future__ import annotations
 import argparse
+import math
 from pathlib import Path
+import signal
 import sys
-import time
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
@@ -27,6 +29,12 @@ except Exception:
     # Allow importing this module without JACK present (for tests on non-Pi).
     jack = None  # type: ignore
 
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    # Optional: fall back to linear interpolation without SciPy
+    resample_poly = None
+
 
 def db_to_linear(db: float) -> float:
     return float(10.0 ** (db / 20.0))
@@ -35,6 +43,11 @@ def db_to_linear(db: float) -> float:
 def simple_resample(x: np.ndarray, sr_in: int, sr_out: int) -> np.ndarray:
     if sr_in == sr_out:
         return x.astype(np.float32, copy=False)
+    if resample_poly is not None:
+        # Polyphase FIR: anti-aliased, float32 in/out, no time vectors
+        g = math.gcd(int(sr_in), int(sr_out))
+        y = resample_poly(x.astype(np.float32, copy=False), int(sr_out) // g, int(sr_in) // g)
+        return y.astype(np.float32, copy=False)
     # Linear interpolation
     dur = x.shape[0] / float(sr_in)
     n_out = int(round(dur * sr_out))
@@ -46,19 +59,98 @@ def simple_resample(x: np.ndarray, sr_in: int, sr_out: int) -> np.ndarray:
     return y.astype(np.float32)
 
 
-def find_bullen_input_port(client: jack.Client, input_index: int) -> Optional[str]:
+def fill_block(buf: np.ndarray, x: np.ndarray, i: int, loop: bool) -> int:
+    """Fill one JACK period from x starting at position i; returns the next position."""
+    frames = buf.shape[0]
+    n = x.shape[0]
+    end = i + frames
+    if i >= n:
+        if loop:
+            i = 0
+            end = frames
+        else:
+            buf[:] = 0.0
+            return i
+    if end <= n:
+        buf[:] = x[i:end]
+        return end
+    # Tail then wrap/zero
+    tail = n - i
+    if tail > 0:
+        buf[:tail] = x[i:n]
+    if loop:
+        wrap = frames - tail
+        wrap_n = min(wrap, n)
+        buf[tail:tail+wrap_n] = x[:wrap_n]
+        if wrap_n < wrap:
+            buf[tail+wrap_n:] = 0.0
+        return wrap_n
+    buf[tail:] = 0.0
+    return n
+
+
+def load_feed_audio(wav_path: Path, samplerate: int, gain_db: float = 0.0) -> np.ndarray:
+    """Read a WAV file as mono float32 at the given samplerate, with gain and clipping applied."""
+    with sf.SoundFile(str(wav_path)) as f:
+        sr = f.samplerate
+        data = np.empty(f.frames, dtype=np.float32)
+        if f.channels == 1:
+            # Decode straight into the mono buffer
+            f.read(dtype='float32', out=data)
+        else:
+            # Mixdown to mono into the preallocated buffer (no extra full-length temporary)
+            np.mean(f.read(dtype='float32'), axis=1, out=data)
+    x = simple_resample(data, sr, samplerate)
+    # x is a float32 buffer owned here: gain and clip in place, no full-length temporaries
+    if gain_db != 0.0:
+        x *= np.float32(db_to_linear(gain_db))
+    # Clip to [-1, 1]
+    np.clip(x, -1.0, 1.0, out=x)
+    return x
+
+
+def _scan_bullen_ports(client: jack.Client) -> Tuple[set, Dict[str, str]]:
+    """Exact input port names and a lowercase ':in_<N>' suffix -> name map for Bullen-like ports.
+
+    The result is memoized on the client; find_bullen_input_port only rescans on a miss.
+    """
+    names = [p.name for p in client.get_ports(is_input=True)]
+    by_suffix: Dict[str, str] = {}
+    for name in names:
+        lc = name.lower()
+        if "bullen" not in lc:
+            continue
+        i = lc.rfind(":in_")
+        if i >= 0:
+            # First hit wins, as with the previous linear scan
+            by_suffix.setdefault(lc[i + 4:], name)
+    ports = (set(names), by_suffix)
+    try:
+        setattr(client, "_bullen_port_cache", ports)
+    except AttributeError:
+        pass
+    return ports
+
+
+def _match_bullen_port(ports: Tuple[set, Dict[str, str]], input_index: int) -> Optional[str]:
+    exact, by_suffix = ports
     # Try exact name first
-    exact = f"bullen:in_{input_index}"
-    ports = client.get_ports(is_input=True)
-    names = [p.name for p in ports]
-    if exact in names:
-        return exact
-    # Fallback: case-insensitive contains
-    target_lc = f":in_{input_index}".lower()
-    for p in ports:
-        if "bullen" in p.name.lower() and target_lc in p.name.lower():
-            return p.name
-    return None
+    name = f"bullen:in_{input_index}"
+    if name in exact:
+        return name
+    # Fallback: case-insensitive ':in_<N>' on a Bullen port
+    return by_suffix.get(str(input_index))
+
+
+def find_bullen_input_port(client: jack.Client, input_index: int) -> Optional[str]:
+    # Cached ports first: no JACK round-trip or scan when the port is already known
+    cached = getattr(client, "_bullen_port_cache", None)
+    if cached is not None:
+        name = _match_bullen_port(cached, input_index)
+        if name is not None:
+            return name
+    # Miss (or no cache yet): the graph may have changed, rescan once
+    return _match_bullen_port(_scan_bullen_ports(client), input_index)
 
 
 def main() -> None:
@@ -79,56 +171,20 @@ def main() -> None:
         print("JACK library not available. Install 'JACK-Client' and run on Raspberry Pi with PipeWire-JACK.")
         sys.exit(1)
 
-    data, sr = sf.read(str(wav_path), dtype='float32', always_2d=False)
-    if data.ndim > 1:
-        # Mixdown to mono
-        data = data.mean(axis=1).astype(np.float32)
-    data = data.astype(np.float32, copy=False)
-
     client = jack.Client(args.client_name, no_start_server=False)
     try:
         jack_sr = client.samplerate
-        x = simple_resample(data, sr, jack_sr)
-        if args.gain_db != 0.0:
-            x = (x * db_to_linear(args.gain_db)).astype(np.float32)
-        # Clip to [-1, 1]
-        x = np.clip(x, -1.0, 1.0)
+        x = load_feed_audio(wav_path, jack_sr, args.gain_db)
 
         outport = client.outports.register('wav_out')
-        pos = {'i': 0}
+        # Everything the RT callback touches is a closure local: no dict or argparse lookups per period
+        loop = bool(args.loop)
+        get_array = outport.get_array
+        pos = 0
 
         def process(frames: int):
-            buf = outport.get_array()
-            n = x.shape[0]
-            i = pos['i']
-            end = i + frames
-            if i >= n:
-                if args.loop:
-                    i = 0
-                    end = frames
-                else:
-                    buf[:] = 0.0
-                    return
-            if end <= n:
-                buf[:] = x[i:end]
-                pos['i'] = end
-            else:
-                # Tail then wrap/zero
-                tail = n - i
-                if tail > 0:
-                    buf[:tail] = x[i:n]
-                if args.loop:
-                    wrap = frames - tail
-                    wrap_n = min(wrap, n)
-                    buf[tail:tail+wrap_n] = x[:wrap_n]
-                    if wrap_n < wrap:
-                        buf[tail+wrap_n:] = 0.0
-                        pos['i'] = wrap_n
-                    else:
-                        pos['i'] = wrap_n
-                else:
-                    buf[tail:] = 0.0
-                    pos['i'] = n
+            nonlocal pos
+            pos = fill_block(get_array(), x, pos, loop)
 
         client.set_process_callback(process)
         client.activate()
@@ -145,11 +201,11 @@ def main() -> None:
                 print(f"Failed to auto-connect to {target}. Connect manually.")
 
         print(f"Streaming {wav_path.name} @ {jack_sr} Hz into bullen:in_{args.input}. Ctrl+C to stop.")
-        try:
-            while True:
-                time.sleep(0.2)
-        except KeyboardInterrupt:
-            pass
+        # Block until Ctrl+C or terminate(): no periodic wakeups next to the RT thread
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())
+        stop.wait()
     finally:
         try:
             client.deactivate()
@@ -13,28 +13,55 @@ Usage:
 """
 from __future__ import annotations
 import argparse
+import functools
 from pathlib import Path
 import math
 import numpy as np
 import soundfile as sf
 
 
+# Samples generated per write in make_tone
+_CHUNK = 1 << 16
+
+
+@functools.lru_cache(maxsize=64)
 def db_to_linear(db: float) -> float:
     return float(10 ** (db / 20.0))
 
 
 def make_tone(path: Path, sr: int, seconds: float, freq: float, amp_db: float = -12.0) -> None:
     n = int(seconds * sr)
-    t = np.arange(n, dtype=np.float32) / float(sr)
-    amp = db_to_linear(amp_db)
-    # Slight fade in/out to avoid clicks
-    fade_len = max(1, int(0.01 * sr))
-    window = np.ones(n, dtype=np.float32)
-    window[:fade_len] = np.linspace(0.0, 1.0, fade_len, dtype=np.float32)
-    window[-fade_len:] = np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
-    x = (amp * np.sin(2 * math.pi * freq * t) * window).astype(np.float32)
+    amp = np.float32(db_to_linear(amp_db))
+    # Fixed-point phase: uint32 wraps exactly once per cycle, so precision does not degrade
+    # with duration (a float32 sample-index ramp loses phase bits on long tones)
+    inc = int(round(freq / sr * 2**32)) & 0xFFFFFFFF
+    # Generate in fixed-size chunks into reused buffers: memory stays constant for long tones
+    step = np.arange(min(n, _CHUNK), dtype=np.uint32)
+    step *= np.uint32(inc)
+    phase = np.empty_like(step)
+    buf = np.empty(len(step), dtype=np.float32)
+    # Slight fade in/out to avoid clicks (only the edges are touched)
+    fade_len = min(n, max(1, int(0.01 * sr)))
+    ramp = np.linspace(0.0, 1.0, fade_len, dtype=np.float32)
+    ramp_out = ramp[::-1]
+    fade_out_start = n - fade_len
     path.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(path), x, sr, subtype='PCM_16', format='WAV')
+    with sf.SoundFile(str(path), 'w', samplerate=sr, channels=1, subtype='PCM_16', format='WAV') as f:
+        for start in range(0, n, _CHUNK):
+            m = min(_CHUNK, n - start)
+            x = buf[:m]
+            np.add(step[:m], np.uint32((start * inc) & 0xFFFFFFFF), out=phase[:m])
+            x[:] = phase[:m]
+            x *= np.float32(2 * math.pi / 2**32)
+            np.sin(x, out=x)
+            x *= amp
+            if start < fade_len:
+                k = min(m, fade_len - start)
+                x[:k] *= ramp[start:start + k]
+            lo = max(start, fade_out_start)
+            if lo < start + m:
+                x[lo - start:] *= ramp_out[lo - fade_out_start:start + m - fade_out_start]
+            f.write(x)
     print(f"Wrote {path} @ {sr} Hz, {seconds:.2f} s, {freq:.1f} Hz, {amp_db:.1f} dBFS")
 
 
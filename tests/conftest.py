@@ -1,3 +1,4 @@
+import functools
 import threading
 from typing import Any, Dict
 import time
@@ -31,11 +32,16 @@ class FakeEngine:
     def __init__(self, num_inputs: int = 6):
         self.num_inputs = num_inputs
         self.num_outputs = 2  # Default to 2 outputs for testing
-        self.selected_ch = 0
-        self.gains = np.ones(num_inputs)
-        self.mutes = np.zeros(num_inputs, dtype=bool)
-        self.vu_peak = np.random.rand(num_inputs) * 0.5
-        self.vu_rms = np.random.rand(num_inputs) * 0.3
+        self._samplerate = 48000
+        self._blocksize = 128
+        self._running = False
+        self._lock = threading.Lock()
+        self._tick = 0
+        self._selected = 0
+        self._gains_lin = np.ones(num_inputs, dtype=np.float32)
+        self._mutes = np.zeros(num_inputs, dtype=bool)
+        self._vu_peak = np.zeros(num_inputs, dtype=np.float32)
+        self._vu_rms = np.zeros(num_inputs, dtype=np.float32)
         self.config = {
             "inputs": num_inputs,
             "outputs": self.num_outputs,
@@ -51,6 +57,8 @@ class FakeEngine:
         
         # Mock noise suppressor
         self.noise_suppressor = FakeNoiseSuppressor() if self.config.get("noise_suppression", {}).get("enabled") else None
+        # Last get_state() result; dropped by every setter
+        self._last_state = None
 
     # API used by app
     def start(self) -> None:
@@ -62,11 +70,13 @@ class FakeEngine:
     def set_selected_channel(self, idx: int) -> None:
         with self._lock:
             self._selected = max(0, min(self.num_inputs - 1, int(idx)))
+            self._last_state = None
 
     def set_gain_linear(self, idx: int, gain: float) -> None:
         with self._lock:
             if 0 <= idx < self.num_inputs:
                 self._gains_lin[idx] = float(max(0.0, gain))
+                self._last_state = None
 
     def set_gain_db(self, idx: int, gain_db: float) -> None:
         self.set_gain_linear(idx, self.db_to_linear(gain_db))
@@ -75,9 +85,11 @@ class FakeEngine:
         with self._lock:
             if 0 <= idx < self.num_inputs:
                 self._mutes[idx] = bool(mute)
+                self._last_state = None
 
     # Helpers
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def db_to_linear(db: float) -> float:
         return float(10.0 ** (db / 20.0))
 
@@ -89,30 +101,43 @@ class FakeEngine:
     def get_state(self) -> Dict[str, Any]:
         with self._lock:
             self._tick += 1
+            # The simulated state only depends on selection, gains and mutes
+            if self._last_state is not None:
+                return self._copy_state(self._last_state)
             # Simulate simple VU: selected channel active, others low
-            rms_base = 0.02
-            peak_base = 0.05
-            self._vu_rms[:] = rms_base
-            self._vu_peak[:] = peak_base
+            self._vu_rms.fill(0.02)
+            self._vu_peak.fill(0.05)
             self._vu_rms[self._selected] = 0.1
             self._vu_peak[self._selected] = 0.2
             # Apply mutes by zeroing VU
-            mut_idx = np.where(self._mutes)[0]
-            if mut_idx.size:
-                self._vu_rms[mut_idx] = 0.0
-                self._vu_peak[mut_idx] = 0.0
-            return {
+            self._vu_rms[self._mutes] = 0.0
+            self._vu_peak[self._mutes] = 0.0
+            self._last_state = {
                 'samplerate': self._samplerate,
                 'frames_per_period': self._blocksize,
                 'selected_channel': int(self._selected + 1),
                 'gains_linear': self._gains_lin.tolist(),
-                'gains_db': [float(self.linear_to_db(g)) for g in self._gains_lin],
+                'gains_db': (20.0 * np.log10(np.maximum(self._gains_lin, 1e-12))).tolist(),
                 'mutes': self._mutes.astype(bool).tolist(),
                 'vu_peak': self._vu_peak.tolist(),
                 'vu_rms': self._vu_rms.tolist(),
                 'recording': False,
                 'rec_dropped_buffers': [0] * self.num_inputs,
             }
+            return self._copy_state(self._last_state)
+
+    @staticmethod
+    def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        # Fresh lists per call, as AudioEngine.get_state returns: callers may mutate them
+        return {k: list(v) if isinstance(v, list) else v for k, v in state.items()}
+
+
+@pytest.fixture(scope="session")
+def noise():
+    """Shared white noise (float32, seeded); tests slice it instead of drawing new samples."""
+    buf = np.random.default_rng(0).standard_normal(65536).astype(np.float32)
+    buf.flags.writeable = False  # shared across tests: slices must be copied before in-place use
+    return buf
 
 
 @pytest.fixture(scope="session")
@@ -122,8 +147,29 @@ def app_instance():
     return app
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client(app_instance):
-    # TestClient manages startup/shutdown events for the app
+    # TestClient manages startup/shutdown events for the app; run them once per session
     with TestClient(app_instance) as c:
         yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_engine(request):
+    """Restore FakeEngine state mutated by a test that used the shared client."""
+    if "client" not in request.fixturenames:
+        yield
+        return
+    engine = request.getfixturevalue("app_instance").state.engine
+    with engine._lock:
+        gains = engine._gains_lin.copy()
+        mutes = engine._mutes.copy()
+        selected = engine._selected
+        tick = engine._tick
+    yield
+    with engine._lock:
+        np.copyto(engine._gains_lin, gains)
+        np.copyto(engine._mutes, mutes)
+        engine._selected = selected
+        engine._tick = tick
+        engine._last_state = None
@@ -81,12 +81,12 @@ class TestAdaptiveProcessor:
         assert isinstance(stats.onset_detected, bool)
         assert isinstance(stats.silence_detected, bool)
     
-    def test_adapt_parameters(self):
+    def test_adapt_parameters(self, noise):
         """Test parameter adaptation based on signal statistics."""
         processor = AdaptiveProcessor(samplerate=48000, channels=6)
         
         # Simulate signal analysis
-        signal = np.random.randn(4800) * 0.1
+        signal = noise[:4800] * 0.1
         processor.analyze_signal(signal, channel=0)
         
         initial_gain = processor.adaptive_gains[0]
@@ -95,12 +95,12 @@ class TestAdaptiveProcessor:
         # Parameters should adapt
         assert processor.adaptive_gains[0] != initial_gain or processor.noise_gates[0] > 0
     
-    def test_process_signal(self):
+    def test_process_signal(self, noise):
         """Test adaptive processing of audio signal."""
         processor = AdaptiveProcessor(samplerate=48000, channels=6)
         
         # Generate test signal
-        signal = np.random.randn(4800) * 0.5
+        signal = noise[:4800] * 0.5
         
         processed = processor.process(signal, channel=0)
         
@@ -119,13 +119,13 @@ class TestIntelligentMixer:
         assert len(mixer.mix_weights) == 6
         assert np.allclose(np.sum(mixer.mix_weights), 1.0)
     
-    def test_update_correlation(self):
+    def test_update_correlation(self, noise):
         """Test correlation matrix updates."""
         mixer = IntelligentMixer(channels=6, samplerate=48000)
         
         # Generate correlated signals
-        base = np.random.randn(1000)
-        signals = [base + np.random.randn(1000) * 0.1 for _ in range(6)]
+        base = noise[:1000]
+        signals = [base + noise[1000 * (i + 1):1000 * (i + 2)] * 0.1 for i in range(6)]
         
         mixer.update_correlation(signals)
         
@@ -154,12 +154,12 @@ class TestIntelligentMixer:
         # Silent channel should have lowest priority
         assert mixer.priority_scores[5] < mixer.priority_scores[0]
     
-    def test_intelligent_mixing(self):
+    def test_intelligent_mixing(self, noise):
         """Test intelligent mixing of signals."""
         mixer = IntelligentMixer(channels=6, samplerate=48000)
         
         # Generate test signals
-        signals = [np.random.randn(1000) * 0.1 for _ in range(6)]
+        signals = [noise[1000 * i:1000 * (i + 1)] * 0.1 for i in range(6)]
         stats = [SignalStatistics() for _ in range(6)]
         
         mixed = mixer.mix(signals, stats)
@@ -306,12 +306,12 @@ class TestAdvancedTelemetry:
         assert thd > 0
         assert thd < 100  # THD percentage
     
-    def test_measure_snr(self):
+    def test_measure_snr(self, noise):
         """Test Signal-to-Noise Ratio measurement."""
         telemetry = AdvancedTelemetry(channels=6)
         
         # Generate signal with known SNR
-        signal = np.random.randn(1000) * 0.5
+        signal = noise[:1000] * 0.5
         noise_floor = 0.001
         
         snr = telemetry.measure_snr(signal, noise_floor)
@@ -346,6 +346,16 @@ class TestAdvancedTelemetry:
         score = telemetry.get_health_score()
         assert 0 <= score < 100
 
+    def test_health_score_before_measurement(self):
+        """An unmeasured system is not penalized for SNR."""
+        telemetry = AdvancedTelemetry(channels=6)
+        assert np.all(telemetry.snr_measurements >= 40.0)
+        assert telemetry.get_health_score() == 100.0
+
+        # Only a measured low SNR costs points
+        telemetry.snr_measurements[:] = 20.0
+        assert telemetry.get_health_score() == 90.0
+
 
 class TestIntegration:
     """Test integration of all advanced features."""
@@ -1,4 +1,10 @@
+import asyncio
+import time
+
+import numpy as np
 import pytest
+import soundfile as sf
+from starlette.websockets import WebSocket
 
 
 def test_root_redirect(client):
@@ -63,6 +69,28 @@ def test_set_gain_bad_payload(client):
     assert r.status_code == 400
 
 
+def test_set_gain_rejects_non_finite(client):
+    # Fast path (slider-shaped body) and full JSON decode both see 1e999 as inf
+    r = client.post("/api/gain/1", content=b'{"gain_db": 1e999}', headers={"content-type": "application/json"})
+    assert r.status_code == 400
+    r = client.post("/api/gain/1", content=b'{"gain_linear": -1e999, "x": 1}', headers={"content-type": "application/json"})
+    assert r.status_code == 400
+    r = client.post("/api/gain/1", json={"gain_db": "loud"})
+    assert r.status_code == 400
+    st = client.get("/api/state").json()
+    assert st["gains_linear"][0] == 1.0
+
+
+def test_set_gain_clamped_to_ui_range(client):
+    client.post("/api/gain/2", json={"gain_db": 100.0})
+    client.post("/api/gain/3", json={"gain_linear": 1000.0})
+    client.post("/api/gain/4", json={"gain_db": -200.0})
+    st = client.get("/api/state").json()
+    assert 19.9 <= st["gains_db"][1] <= 20.1
+    assert 9.9 <= st["gains_linear"][2] <= 10.1
+    assert -60.1 <= st["gains_db"][3] <= -59.9
+
+
 def test_set_mute(client):
     r = client.post("/api/mute/1", json={"mute": True})
     assert r.status_code == 200
@@ -80,7 +108,96 @@ def test_websocket_vu_stream(client):
     with client.websocket_connect("/ws/vu") as ws:
         # receive a few payloads
         payload = ws.receive_json()
-        assert set(["vu_peak", "vu_rms", "selected_channel", "mutes", "gains_db"]) <= set(payload.keys())
+        # Compact keys: peak/RMS (int dB), selected channel, mutes, gains (0.1 dB)
+        assert set(["p", "r", "s", "m", "g"]) <= set(payload.keys())
         # Expected list lengths
-        assert len(payload["vu_peak"]) == 6
-        assert len(payload["vu_rms"]) == 6
+        assert len(payload["p"]) == 6
+        assert len(payload["r"]) == 6
+        assert all(isinstance(v, int) and -127 <= v <= 127 for v in payload["p"])
+
+
+@pytest.mark.timeout(5)
+def test_websocket_vu_gain_delta(client):
+    with client.websocket_connect("/ws/vu") as ws:
+        # First frame after connecting is full
+        full = ws.receive_json()
+        assert set(["p", "r", "s", "m", "g"]) <= set(full.keys())
+        assert full["g"][1] == 0
+        client.post("/api/gain/2", json={"gain_db": -6.0})
+        # Only the changed field, and only the changed channel (index keys are JSON strings)
+        delta = ws.receive_json()
+        assert delta == {"g": {"1": -60}}
+
+
+@pytest.mark.timeout(5)
+def test_websocket_vu_lagging_client_gets_full_frame(client, monkeypatch):
+    orig_send = WebSocket.send
+    stalled = []
+
+    async def slow_send(self, message):
+        # Stall the first data frame so the client's one-frame mailbox backs up
+        if message["type"] == "websocket.send" and not stalled:
+            stalled.append(message)
+            await asyncio.sleep(1.0)
+        await orig_send(self, message)
+
+    monkeypatch.setattr(WebSocket, "send", slow_send)
+    with client.websocket_connect("/ws/vu") as ws:
+        time.sleep(0.2)
+        # Queued as a delta while the writer is stuck on the first frame...
+        client.post("/api/gain/2", json={"gain_db": -6.0})
+        time.sleep(0.3)
+        # ...then replaced: that delta is dropped, so the next frame must carry the full state
+        client.post("/api/gain/3", json={"gain_db": -12.0})
+        first = ws.receive_json()
+        assert set(["p", "r", "s", "m", "g"]) <= set(first.keys())
+        frame = ws.receive_json()
+        assert set(["p", "r", "s", "m", "g"]) <= set(frame.keys())
+        assert frame["g"][1:3] == [-60, -120]
+
+
+@pytest.mark.parametrize("name", [
+    "..%2Fx.wav",      # ../x.wav
+    "..%5Cx.wav",      # backslash separator
+    "x%00.wav",        # NUL byte
+    "x.txt",           # not a WAV
+])
+def test_delete_upload_rejects_bad_names(client, tmp_path, monkeypatch, name):
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    outside = tmp_path / "x.wav"
+    outside.write_bytes(b"")
+    monkeypatch.setattr("app.server.app._UPLOADS_DIR", uploads)
+    r = client.delete(f"/api/upload/{name}")
+    assert r.status_code == 400
+    assert outside.exists()
+
+
+def test_delete_upload_valid_name(client, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.server.app._UPLOADS_DIR", tmp_path)
+    name = "samtal åäö_1a2b3c4d.wav"
+    (tmp_path / name).write_bytes(b"")
+    r = client.delete(f"/api/upload/{name}")
+    assert r.status_code == 200
+    assert r.json() == {"ok": True, "deleted": name}
+    assert not (tmp_path / name).exists()
+    assert client.delete(f"/api/upload/{name}").status_code == 404
+
+
+def test_feed_start_shares_decoded_audio_across_gains(client, app_instance, tmp_path, monkeypatch):
+    wav = tmp_path / "feed.wav"
+    sf.write(str(wav), np.full(480, 0.25, dtype=np.float32), 48000)
+    started = []
+    monkeypatch.setattr(app_instance.state.engine, "start_feed",
+                        lambda ch, samples, loop, gain: started.append((ch, samples, loop, gain)), raising=False)
+    for ch, gain_db in ((1, 0.0), (2, -6.0)):
+        r = client.post("/api/tools/feed/start", json={"file": str(wav), "input": ch, "gain_db": gain_db})
+        assert r.status_code == 200
+        assert r.json()["mode"] == "in_process"
+    (ch1, a, _, g1), (ch2, b, _, g2) = started
+    assert (ch1, ch2) == (0, 1)
+    # One unity-gain decode serves both feeds; each feed carries its own gain
+    assert a is b
+    assert np.allclose(a, 0.25, atol=1e-4)
+    assert g1 == 1.0
+    assert 0.49 <= g2 <= 0.51
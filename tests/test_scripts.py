@@ -31,7 +31,8 @@ def test_simple_resample_identity():
 
 
 def test_simple_resample_up_down():
-    x = np.sin(2 * np.pi * 440.0 * np.arange(100, dtype=np.float32) / 1000.0).astype(np.float32)
+    # In-band tone: the resampler low-passes near Nyquist (440 Hz at 1 kHz would be filtered)
+    x = np.sin(2 * np.pi * 100.0 * np.arange(100, dtype=np.float32) / 1000.0).astype(np.float32)
     y = simple_resample(x, 1000, 2000)
     z = simple_resample(y, 2000, 1000)
     assert len(y) == 200
@@ -58,3 +59,40 @@ def test_find_bullen_input_port_prefers_exact():
     c2 = C(["System:Capture_1", "BULLEN:IN_6"]) 
     # case-insensitive contains fallback
     assert find_bullen_input_port(c2, 6).lower().endswith(":in_6")
+
+
+def test_find_bullen_input_port_scans_only_on_miss():
+    class P:
+        def __init__(self, name):
+            self.name = name
+
+    class C:
+        def __init__(self, names):
+            self.names = names
+            self.scans = 0
+        def get_ports(self, is_input=True):
+            self.scans += 1
+            return [P(n) for n in self.names]
+
+    c = C(["bullen:in_1", "bullen:in_2"])
+    assert find_bullen_input_port(c, 1) == "bullen:in_1"
+    assert find_bullen_input_port(c, 2) == "bullen:in_2"
+    assert c.scans == 1
+    # A port that appeared later is found by rescanning on the miss
+    c.names.append("bullen:in_3")
+    assert find_bullen_input_port(c, 3) == "bullen:in_3"
+    assert c.scans == 2
+    assert find_bullen_input_port(c, 4) is None
+
+
+def test_fill_block_loops_and_stops():
+    from scripts.feed_wav_to_input import fill_block
+
+    x = np.arange(1, 6, dtype=np.float32)  # 5 samples
+    buf = np.zeros(4, dtype=np.float32)
+    pos = fill_block(buf, x, 3, loop=True)
+    assert buf.tolist() == [4, 5, 1, 2]
+    assert pos == 2
+    pos = fill_block(buf, x, 3, loop=False)
+    assert buf.tolist() == [4, 5, 0, 0]
+    assert pos == 5
@@ -1,4 +1,7 @@
-from app.engine.audio_engine import db_to_linear, linear_to_db
+import numpy as np
+
+from app.engine.audio_engine import db_to_linear, db_to_linear_array, linear_to_db, linear_to_db_array
+from app.engine.dummy_engine import DummyEngine
 
 
 def approx(a: float, b: float, tol: float = 1e-6) -> bool:
@@ -17,12 +20,31 @@ def test_linear_to_db_basic():
 
 
 def test_roundtrip_values():
-    for db in (-60.0, -20.0, -6.0, 0.0, 6.0, 12.0):
-        lin = db_to_linear(db)
-        db2 = linear_to_db(lin)
-        assert abs(db - db2) < 1e-6
+    dbs = (-60.0, -20.0, -6.0, 0.0, 6.0, 12.0)
+    lins = [db_to_linear(db) for db in dbs]
+    for db, lin in zip(dbs, lins):
+        assert abs(db - linear_to_db(lin)) < 1e-6
+    # Vectorized helper must agree: one pass back to dB (float64, same floor as the scalar)
+    assert np.allclose(linear_to_db_array(lins), dbs, rtol=0.0, atol=1e-6)
 
 
 def test_linear_to_db_zero_floor():
     # linear_to_db guards against log10(0)
     assert linear_to_db(0.0) < -200.0
+
+
+def test_db_to_linear_array_matches_scalar():
+    dbs = [-120.0, -60.0, -6.5, 0.0, 3.0, 24.0]
+    lins = db_to_linear_array(dbs)
+    assert lins.dtype == np.float32
+    assert np.allclose(lins, [db_to_linear(db) for db in dbs], rtol=1e-4, atol=0.0)
+
+
+def test_set_gain_db_scalar_and_array():
+    engine = DummyEngine({"inputs": 6, "gains_db": [-6.0, 0.0, 6.0]})
+    assert np.allclose(engine.gains, [db_to_linear(-6.0), 1.0, db_to_linear(6.0), 1.0, 1.0, 1.0], rtol=1e-4)
+    # Array from channel 5: values past the last channel are ignored
+    engine.set_gain_db(4, np.array([-20.0, -20.0, -20.0]))
+    assert np.allclose(engine.gains[4:], 0.1, rtol=1e-4)
+    engine.set_gain_db(0, 20.0)
+    assert approx(float(engine.gains[0]), 10.0, tol=1e-4)